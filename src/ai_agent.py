@@ -5,7 +5,7 @@ ChatGPT API 연동 및 프롬프트 엔지니어링 모듈
 
 import os
 from typing import Dict, Any, Optional, List
-from openai import OpenAI
+from openai import OpenAI, AsyncOpenAI
 from dotenv import load_dotenv
 from src.dataset_loader import Persona
 
@@ -33,6 +33,16 @@ class AIAgent:
         self.client = OpenAI(api_key=self.api_key)
         self.model = "gpt-4o-mini"  # 비용 효율적인 모델 사용
     
+    def async_client(self) -> AsyncOpenAI:
+        """
+        비동기 요청용 클라이언트를 새로 만듭니다.
+        
+        비동기 클라이언트의 연결 풀은 처음 사용한 이벤트 루프에 묶이므로,
+        asyncio.run 한 번마다 코루틴 안에서 `async with agent.async_client() as aclient:`로
+        만들어 *_async 메서드에 넘깁니다.
+        """
+        return AsyncOpenAI(api_key=self.api_key)
+    
     def _build_persona_context(self, persona: Persona) -> str:
         """
         페르소나 정보를 핵심 특성만 추출하여 컨텍스트 문자열로 변환합니다.
@@ -107,6 +117,50 @@ class AIAgent:
         Returns:
             응답 딕셔너리 (score, reasoning)
         """
+        try:
+            response = self.client.chat.completions.create(
+                **self._survey_request(persona, question, scale_description)
+            )
+            
+            content = response.choices[0].message.content.strip()
+            
+            return self._survey_result(persona, question, content)
+            
+        except Exception as e:
+            return self._survey_error(persona, question, e)
+    
+    async def respond_to_survey_question_async(
+        self,
+        aclient: AsyncOpenAI,
+        persona: Persona,
+        question: str,
+        scale_description: str = "1(전혀 동의하지 않음) ~ 7(매우 동의함)"
+    ) -> Dict[str, Any]:
+        """
+        respond_to_survey_question의 비동기 버전
+        
+        여러 설문 질문을 동시에 요청할 때 사용합니다 (응답 형식 동일).
+        aclient는 현재 이벤트 루프에서 만든 async_client()를 넘깁니다.
+        """
+        try:
+            response = await aclient.chat.completions.create(
+                **self._survey_request(persona, question, scale_description)
+            )
+            
+            content = response.choices[0].message.content.strip()
+            
+            return self._survey_result(persona, question, content)
+            
+        except Exception as e:
+            return self._survey_error(persona, question, e)
+    
+    def _survey_request(
+        self,
+        persona: Persona,
+        question: str,
+        scale_description: str
+    ) -> Dict[str, Any]:
+        """설문 응답용 Chat Completions 요청 인자를 생성합니다."""
         persona_context = self._build_persona_context(persona)
         
         system_prompt = f"""당신은 설문조사에 참여하는 응답자입니다.
@@ -124,42 +178,36 @@ class AIAgent:
 이유: [당신의 특성을 고려한 간단한 설명]
 """
         
-        user_prompt = f"질문: {question}"
-        
-        try:
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": user_prompt}
-                ],
-                temperature=0.7,
-                max_tokens=200
-            )
-            
-            content = response.choices[0].message.content.strip()
-            
-            # 응답 파싱
-            score = self._extract_score(content)
-            reasoning = self._extract_reasoning(content)
-            
-            return {
-                "persona_id": persona.id,
-                "question": question,
-                "score": score,
-                "reasoning": reasoning,
-                "raw_response": content
-            }
-            
-        except Exception as e:
-            return {
-                "persona_id": persona.id,
-                "question": question,
-                "score": None,
-                "reasoning": None,
-                "error": str(e),
-                "raw_response": None
-            }
+        return {
+            "model": self.model,
+            "messages": [
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": f"질문: {question}"}
+            ],
+            "temperature": 0.7,
+            "max_tokens": 200
+        }
+    
+    def _survey_result(self, persona: Persona, question: str, content: str) -> Dict[str, Any]:
+        """설문 응답 딕셔너리 (점수와 이유 파싱)"""
+        return {
+            "persona_id": persona.id,
+            "question": question,
+            "score": self._extract_score(content),
+            "reasoning": self._extract_reasoning(content),
+            "raw_response": content
+        }
+    
+    def _survey_error(self, persona: Persona, question: str, e: Exception) -> Dict[str, Any]:
+        """설문 응답 실패 시 딕셔너리"""
+        return {
+            "persona_id": persona.id,
+            "question": question,
+            "score": None,
+            "reasoning": None,
+            "error": str(e),
+            "raw_response": None
+        }
     
     def respond_to_interview_question(
         self,
@@ -178,9 +226,23 @@ class AIAgent:
         Returns:
             응답 딕셔너리 (response)
         """
+        return self.respond_with_prebuilt(
+            persona,
+            self.build_persona_prompt(persona),
+            question,
+            context
+        )
+    
+    def build_persona_prompt(self, persona: Persona) -> str:
+        """
+        인터뷰 응답용 페르소나 시스템 프롬프트를 생성합니다.
+        
+        질문과 무관한 부분만 담으므로 한 페르소나의 모든 질문에 재사용할 수 있고,
+        같은 접두부가 반복되어 서버 측 프롬프트 캐시도 적중합니다.
+        """
         persona_context = self._build_persona_context(persona)
         
-        system_prompt = f"""당신은 인터뷰에 참여하는 응답자입니다.
+        return f"""당신은 인터뷰에 참여하는 응답자입니다.
 주어진 페르소나의 특성과 배경을 바탕으로 질문에 진정성 있고 구체적으로 답변해야 합니다.
 
 {persona_context}
@@ -190,40 +252,112 @@ class AIAgent:
 - 자연스럽고 인간적인 어조로 답변하세요.
 - 너무 짧거나 형식적이지 않게, 3-5문장 정도로 답변하세요.
 """
+    
+    def respond_with_prebuilt(
+        self,
+        persona: Persona,
+        persona_prompt: str,
+        question: str,
+        context: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        미리 생성한 페르소나 프롬프트로 인터뷰 질문에 응답합니다.
         
-        if context:
-            system_prompt += f"\n\n추가 컨텍스트:\n{context}"
-        
-        user_prompt = f"질문: {question}"
+        Args:
+            persona: 응답할 페르소나
+            persona_prompt: build_persona_prompt로 생성한 프롬프트
+            question: 인터뷰 질문
+            context: 추가 컨텍스트 (선택사항)
         
+        Returns:
+            응답 딕셔너리 (response)
+        """
         try:
             response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": user_prompt}
-                ],
-                temperature=0.8,
-                max_tokens=500
+                **self._interview_request(persona, persona_prompt, question, context)
             )
             
             content = response.choices[0].message.content.strip()
             
-            return {
-                "persona_id": persona.id,
-                "question": question,
-                "response": content,
-                "raw_response": content
-            }
+            return self._interview_result(persona, question, content)
             
         except Exception as e:
-            return {
-                "persona_id": persona.id,
-                "question": question,
-                "response": None,
-                "error": str(e),
-                "raw_response": None
-            }
+            return self._interview_error(persona, question, e)
+    
+    async def _respond_async(
+        self,
+        aclient: AsyncOpenAI,
+        persona: Persona,
+        question: str,
+        context: Optional[str] = None,
+        persona_prompt: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        respond_with_prebuilt의 비동기 버전
+        
+        여러 인터뷰 질문을 동시에 요청할 때 사용합니다 (응답 형식 동일).
+        aclient는 현재 이벤트 루프에서 만든 async_client()를 넘기며,
+        persona_prompt가 없으면 새로 생성합니다.
+        """
+        if persona_prompt is None:
+            persona_prompt = self.build_persona_prompt(persona)
+        
+        try:
+            response = await aclient.chat.completions.create(
+                **self._interview_request(persona, persona_prompt, question, context)
+            )
+            
+            content = response.choices[0].message.content.strip()
+            
+            return self._interview_result(persona, question, content)
+            
+        except Exception as e:
+            return self._interview_error(persona, question, e)
+    
+    def _interview_request(
+        self,
+        persona: Persona,
+        persona_prompt: str,
+        question: str,
+        context: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """인터뷰 응답용 Chat Completions 요청 인자를 생성합니다."""
+        system_prompt = persona_prompt
+        
+        # 질문별 컨텍스트는 페르소나 접두부 뒤에 붙여 프롬프트 캐시가 유지되도록 함
+        if context:
+            system_prompt += f"\n\n추가 컨텍스트:\n{context}"
+        
+        return {
+            "model": self.model,
+            "messages": [
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": f"질문: {question}"}
+            ],
+            "temperature": 0.8,
+            "max_tokens": 500,
+            # 같은 페르소나의 요청을 같은 캐시 키로 묶어 접두부 캐시 적중률을 높임
+            "extra_body": {"prompt_cache_key": f"persona-{persona.id}"}
+        }
+    
+    def _interview_result(self, persona: Persona, question: str, content: str) -> Dict[str, Any]:
+        """인터뷰 응답 딕셔너리"""
+        return {
+            "persona_id": persona.id,
+            "question": question,
+            "response": content,
+            "raw_response": content
+        }
+    
+    def _interview_error(self, persona: Persona, question: str, e: Exception) -> Dict[str, Any]:
+        """인터뷰 응답 실패 시 딕셔너리"""
+        return {
+            "persona_id": persona.id,
+            "question": question,
+            "response": None,
+            "error": str(e),
+            "raw_response": None
+        }
     
     def conduct_follow_up(
         self,
@@ -4,9 +4,11 @@ Twin-2K-500 데이터셋 로더
 """
 
 import pandas as pd
+import numpy as np
 import json
 from typing import List, Dict, Any, Optional
 from dataclasses import dataclass
+from functools import cached_property
 import os
 
 
@@ -21,6 +23,11 @@ class Persona:
     
     def get_summary(self) -> str:
         """페르소나의 요약 정보를 반환합니다."""
+        return self.summary
+    
+    @cached_property
+    def summary(self) -> str:
+        """페르소나 요약 문자열 (처음 접근할 때 한 번만 생성, data는 생성 후 변경되지 않음)"""
         summary_parts = []
         
         # 주요 필드만 표시
@@ -43,6 +50,7 @@ class DatasetLoader:
         self.csv_path = csv_path
         self.df = None
         self.personas = []
+        self._id_index: Dict[str, Persona] = {}
         self.stats = None
     
     def load(self, subset: str = "full_persona") -> None:
@@ -56,7 +64,7 @@ class DatasetLoader:
         
         try:
             # CSV 파일 로드
-            self.df = pd.read_csv(self.csv_path, encoding='utf-8-sig')
+            self.df = self._categorize_columns(pd.read_csv(self.csv_path, encoding='utf-8-sig'))
             print(f"[OK] Successfully loaded {len(self.df)} personas")
             print(f"[OK] Available columns: {list(self.df.columns)}")
             
@@ -74,17 +82,38 @@ class DatasetLoader:
             print(f"[ERROR] Failed to load dataset: {e}")
             raise
     
+    @staticmethod
+    def _categorize_columns(df: pd.DataFrame) -> pd.DataFrame:
+        """
+        고유값이 적은 문자열 컬럼을 category로 변환합니다.
+        
+        필터링 시 값 비교가 정수 코드 비교로 처리되며, 반복되는 문자열을 한 번만 저장합니다.
+        """
+        categorical_cols = {
+            col: 'category'
+            for col in df.select_dtypes(include='object').columns
+            if df[col].nunique() < len(df) // 2
+        }
+        return df.astype(categorical_cols) if categorical_cols else df
+    
     def _create_personas(self) -> None:
         """DataFrame에서 페르소나 객체를 생성합니다."""
         self.personas = []
         
-        for idx, row in self.df.iterrows():
-            persona_data = row.to_dict()
-            persona_id = str(persona_data.get('id', idx))
-            
+        # ID는 행마다 찾지 않고 컬럼 단위로 한 번에 문자열화 (id 컬럼이 없으면 인덱스 사용)
+        ids = self.df['id'] if 'id' in self.df.columns else self.df.index
+        persona_ids = [str(value) for value in ids]
+        
+        # 행마다 Series를 만드는 iterrows 대신 레코드 dict를 한 번에 생성
+        for persona_id, persona_data in zip(persona_ids, self.df.to_dict('records')):
             persona = Persona(id=persona_id, data=persona_data)
             self.personas.append(persona)
         
+        # ID 조회용 인덱스 (중복 ID는 기존 선형 탐색과 같게 처음 나온 페르소나 유지)
+        self._id_index = {}
+        for persona in self.personas:
+            self._id_index.setdefault(persona.id, persona)
+        
         print(f"[OK] Created {len(self.personas)} persona objects")
     
     def get_all_personas(self) -> List[Persona]:
@@ -93,35 +122,27 @@ class DatasetLoader:
     
     def get_persona_by_id(self, persona_id: str) -> Optional[Persona]:
         """ID로 페르소나를 찾습니다."""
-        for persona in self.personas:
-            if persona.id == persona_id:
-                return persona
-        return None
+        return self._id_index.get(persona_id)
     
     def search_personas(self, filters: Dict[str, Any]) -> List[Persona]:
         """필터 조건에 맞는 페르소나를 검색합니다."""
         if self.df is None:
             return []
         
-        # DataFrame에서 필터링
-        filtered_df = self.df.copy()
+        # 조건별 불리언 마스크를 AND로 결합 (중간 DataFrame 복사 없음)
+        mask = np.ones(len(self.df), dtype=bool)
         
         for field, value in filters.items():
-            if field in filtered_df.columns:
+            if field in self.df.columns:
+                column = self.df[field]
                 if isinstance(value, list):
-                    filtered_df = filtered_df[filtered_df[field].isin(value)]
+                    matched = column.isin(value)
                 else:
-                    filtered_df = filtered_df[filtered_df[field] == value]
-        
-        # 결과를 페르소나 객체로 변환
-        results = []
-        for idx, row in filtered_df.iterrows():
-            persona_data = row.to_dict()
-            persona_id = str(persona_data.get('id', idx))
-            persona = Persona(id=persona_id, data=persona_data)
-            results.append(persona)
+                    matched = column == value
+                mask &= matched.to_numpy(dtype=bool, na_value=False)
         
-        return results
+        # personas는 DataFrame 행 순서대로 생성되므로 위치로 기존 객체를 그대로 반환
+        return [self.personas[i] for i in np.flatnonzero(mask)]
     
     def get_random_sample(self, n: int = 10, seed: Optional[int] = None) -> List[Persona]:
         """랜덤 샘플을 반환합니다."""
@@ -130,10 +151,12 @@ class DatasetLoader:
         if seed is not None:
             random.seed(seed)
         
-        if n >= len(self.personas):
+        total = len(self.personas)
+        if n >= total:
             return self.personas.copy()
         
-        return random.sample(self.personas, n)
+        # 인덱스만 뽑아 필요한 페르소나만 가져옴 (같은 시드면 이전과 같은 표본)
+        return [self.personas[i] for i in random.sample(range(total), n)]
     
     def get_available_fields(self) -> List[str]:
         """사용 가능한 필드 목록을 반환합니다."""
@@ -7,18 +7,184 @@ Digital-Twin-Simulation 프로젝트의 방법론을 적용한 향상된 AI 에
 """
 
 import os
+import re
 import json
 import random
+import asyncio
+import tempfile
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from collections import deque
 import numpy as np
-from typing import List, Dict, Any, Optional, Tuple
-from dataclasses import dataclass
+from typing import List, Dict, Any, Optional, Tuple, Iterator
+from dataclasses import dataclass, replace, asdict, is_dataclass
 from datetime import datetime
-import pandas as pd
 
-from openai import OpenAI
+import httpx
+from openai import OpenAI, AsyncOpenAI, OpenAIError
 from dotenv import load_dotenv
 from src.dataset_loader import Persona
 
+# aiolimiter가 설치되어 있으면 배치 호출의 분당 요청 수를 제한
+try:
+    from aiolimiter import AsyncLimiter
+except ImportError:
+    AsyncLimiter = None
+
+# 서베이 응답 파싱 패턴
+SCORE_RE = re.compile(r'점수:\s*(\d+)')
+REASON_RE = re.compile(r'이유:\s*(.+)')
+# "점수: X"와 "이유:" 표시를 한 번에 제거
+LABEL_STRIP_RE = re.compile(r'점수:\s*\d+\s*\n?|이유:\s*')
+# 표준 응답 형식("점수: X" 바로 다음 줄에 "이유: ...")을 한 번에 파싱
+LIKERT_RE = re.compile(r'점수:\s*(?P<score>\d+)\s*\n?\s*이유:\s*(?P<reason>.+)')
+
+# 신뢰도 계산용 지표 표현
+PERSONAL_INDICATORS = ("개인적으로", "저는", "제 경험", "저의", "나의", "저에게", "제가")
+REASON_INDICATORS = ("이유", "때문에", "왜냐하면", "그래서", "따라서", "때문")
+
+
+def _indicator_pattern(indicators: Tuple[str, ...]) -> "re.Pattern":
+    """지표 표현들을 하나의 alternation으로 컴파일 (긴 표현 우선)"""
+    return re.compile('|'.join(map(re.escape, sorted(indicators, key=len, reverse=True))))
+
+
+def _implied_indicators(indicators: Tuple[str, ...]) -> Dict[str, frozenset]:
+    """각 지표가 매치되면 함께 포함된 것으로 보는 지표들 (예: '때문에' → '때문')"""
+    return {ind: frozenset(other for other in indicators if other in ind) for ind in indicators}
+
+
+PERSONAL_RE = _indicator_pattern(PERSONAL_INDICATORS)
+REASON_INDICATOR_RE = _indicator_pattern(REASON_INDICATORS)
+_PERSONAL_IMPLIED = _implied_indicators(PERSONAL_INDICATORS)
+_REASON_IMPLIED = _implied_indicators(REASON_INDICATORS)
+
+
+def _count_present(pattern: "re.Pattern", implied: Dict[str, frozenset], text: str) -> int:
+    """text에 포함된 서로 다른 지표 수를 한 번의 스캔으로 계산"""
+    found = set()
+    for match in set(pattern.findall(text)):
+        found |= implied[match]
+    return len(found)
+
+
+# 응답 스타일 분류 패턴 (그룹 순서 = 우선순위)
+STYLE_RE = re.compile(
+    r'(?P<emo>감정|느낌|좋아|싫어)|(?P<ana>분석|논리|데이터|통계)'
+    r'|(?P<exp>경험|사용|구매)|(?P<tech>기술|기능|성능)'
+)
+STYLE_LABELS = {'emo': "감성적", 'ana': "분석적", 'exp': "경험적", 'tech': "기술적"}
+_STYLE_PRIORITY = {group: priority for priority, group in enumerate(STYLE_LABELS)}
+
+# 페르소나 특성 테이블 (persona_id % len(테이블)로 선택)
+AGE_GROUPS = ("20대 초반", "20대 후반", "30대 초반", "30대 후반", "40대 초반", "40대 후반", "50대", "60대")
+GENDERS = ("남성", "여성", "기타")
+REGIONS = ("서울", "경기", "부산", "대구", "광주", "대전", "울산", "세종", "기타")
+EDUCATIONS = ("고졸", "대졸", "대학원", "박사")
+INCOMES = ("저소득", "중소득", "고소득", "최고소득")
+OCCUPATIONS = ("사무직", "IT개발자", "마케터", "교사", "의사", "예술가", "판매원", "자영업자", "연구원", "디자이너")
+PRIMARY_TRAITS = (
+    "외향적이고 사교적", "내향적이고 신중", "창의적이고 개방적", 
+    "체계적이고 완벽주의", "낙천적이고 유연", "분석적이고 논리적", 
+    "감성적이고 직관적", "경쟁적이고 야심적"
+)
+SECONDARY_TRAITS = (
+    "협력적", "독립적", "혁신적", "전통적", "모험적", "안정적", 
+    "이상주의적", "현실적"
+)
+TECH_PREFS = ("애플 매니아", "삼성 팬", "구글 픽셀 선호", "중립적", "가성비 중시", "최신 기술 추구", "브랜드 무관심", "안정성 중시")
+SPENDING_STYLES = ("극도 절약형", "절약형", "적당형", "소비형", "프리미엄형", "럭셔리형")
+PREFERENCE_LIFESTYLES = ("미니멀", "활동적", "편안함 추구", "도전적", "전통적", "혁신적")
+CAREERS = ("신입", "경력 3-5년", "경력 10년+", "전문가", "리더", "은퇴")
+INDUSTRIES = ("IT", "금융", "제조", "서비스", "교육", "의료", "예술", "스포츠", "정부", "비영리")
+HOUSEHOLDS = ("싱글", "커플", "가족", "대가족", "독신", "동거")
+INTERESTS = ("기술", "예술", "스포츠", "여행", "독서", "음악", "게임", "요리", "사진", "운동")
+CORE_VALUES = (
+    "성공과 성취", "가족과 관계", "자유와 독립", "안정과 보안", 
+    "창의와 혁신", "전통과 질서", "평등과 정의", "개인적 성장"
+)
+# 브랜드 충성도 단계(persona_id % 4)별 기술 선호도 후보: 높음, 보통, 낮음, 무관심
+TECH_PREF_BY_LOYALTY = (TECH_PREFS[0:3], TECH_PREFS[3:6], TECH_PREFS[6:8], ("기능 중심",))
+LOYALTY_TECH_WIDTHS = tuple(len(prefs) for prefs in TECH_PREF_BY_LOYALTY)
+BRAND_LOYALTY_LABELS = (
+    "브랜드 충성도 높음 (특정 브랜드 선호)",
+    "브랜드 충성도 보통 (선호 브랜드 있음)",
+    "브랜드 충성도 낮음 (브랜드 무관심)",
+    "브랜드 완전 무관심 (기능만 중시)"
+)
+
+
+# 배치 컨텍스트 생성 시 선택할 (특성 테이블, persona_id 오프셋) 순서
+_TRAIT_COLUMNS = (
+    (AGE_GROUPS, 0), (GENDERS, 0), (REGIONS, 0), (EDUCATIONS, 0), (INCOMES, 0), (OCCUPATIONS, 0),
+    (PRIMARY_TRAITS, 0), (SECONDARY_TRAITS, 1),
+    (SPENDING_STYLES, 0), (PREFERENCE_LIFESTYLES, 0),
+    (CAREERS, 0), (INDUSTRIES, 0), (HOUSEHOLDS, 0), (INTERESTS, 0),
+    (CORE_VALUES, 0), (CORE_VALUES, 2),
+)
+_TRAIT_ARRAYS = tuple(np.array(table, dtype=object) for table, _ in _TRAIT_COLUMNS)
+_TRAIT_LENS = np.array([len(table) for table, _ in _TRAIT_COLUMNS], dtype=np.int64)
+_TRAIT_OFFSETS = np.array([offset for _, offset in _TRAIT_COLUMNS], dtype=np.int64)
+# 충성도 단계별 기술 선호도를 이어 붙인 배열과 단계별 시작 위치/폭
+_TECH_PREF_ARRAY = np.array([pref for prefs in TECH_PREF_BY_LOYALTY for pref in prefs], dtype=object)
+_LOYALTY_TECH_WIDTHS = np.array(LOYALTY_TECH_WIDTHS, dtype=np.int64)
+_LOYALTY_TECH_STARTS = np.concatenate(([0], np.cumsum(_LOYALTY_TECH_WIDTHS)[:-1])).astype(np.int64)
+_BRAND_LOYALTY_ARRAY = np.array(BRAND_LOYALTY_LABELS, dtype=object)
+
+
+def _pick_trait_indices_numpy(ids: np.ndarray, lens: np.ndarray, offsets: np.ndarray) -> np.ndarray:
+    """
+    persona_id 배열에서 특성별 선택 인덱스 행렬을 계산
+    
+    반환 행렬의 열: _TRAIT_COLUMNS 순서의 인덱스, 브랜드 충성도 단계, 기술 선호도 인덱스
+    """
+    loyalty = ids % 4
+    tech_idx = _LOYALTY_TECH_STARTS[loyalty] + ids % _LOYALTY_TECH_WIDTHS[loyalty]
+    trait_idx = (ids[:, np.newaxis] + offsets) % lens
+    return np.column_stack([trait_idx, loyalty, tech_idx])
+
+
+# numba가 설치되어 있으면 인덱스 계산 루프를 JIT 컴파일
+try:
+    from numba import njit
+    
+    @njit(cache=True)
+    def _pick_trait_indices(ids, lens, offsets):
+        n = ids.shape[0]
+        k = lens.shape[0]
+        out = np.empty((n, k + 2), dtype=np.int64)
+        for i in range(n):
+            pid = ids[i]
+            for j in range(k):
+                out[i, j] = (pid + offsets[j]) % lens[j]
+            loyalty = pid % 4
+            out[i, k] = loyalty
+            out[i, k + 1] = _LOYALTY_TECH_STARTS[loyalty] + pid % _LOYALTY_TECH_WIDTHS[loyalty]
+        return out
+except ImportError:
+    _pick_trait_indices = _pick_trait_indices_numpy
+
+
+def _json_default(obj: Any) -> Any:
+    """히스토리 JSONL 직렬화 (ResponseMetadata 등 dataclass는 dict로)"""
+    if is_dataclass(obj):
+        return asdict(obj)
+    return str(obj)
+
+
+# HTTP 연결 풀 설정 (동시 요청 간 keep-alive 연결 재사용)
+HTTP_LIMITS = httpx.Limits(max_connections=64, max_keepalive_connections=32)
+HTTP_TIMEOUT = 30.0
+# 429/5xx/연결 오류 시 SDK 내장 지수 백오프 재시도 횟수
+MAX_RETRIES = 6
+
+EMBEDDING_MODEL = "text-embedding-3-small"
+
+SURVEY_SYSTEM_PROMPT = "당신은 주어진 페르소나의 특성을 바탕으로 진정성 있는 응답을 생성하는 AI입니다."
+INTERVIEW_SYSTEM_PROMPT = "당신은 주어진 페르소나의 특성을 바탕으로 자연스럽고 진정성 있는 인터뷰 응답을 생성하는 AI입니다."
+
 @dataclass
 class ResponseMetadata:
     """응답 메타데이터"""
@@ -31,17 +197,66 @@ class ResponseMetadata:
 class EnhancedAIAgent:
     """고도화된 AI 에이전트"""
     
-    def __init__(self, api_key: str = None):
-        """AI 에이전트 초기화"""
+    def __init__(
+        self,
+        api_key: str = None,
+        semantic_cache: bool = False,
+        cache_threshold: float = 0.95,
+        cache_path: Optional[str] = None,
+        history_maxlen: Optional[int] = None,
+        history_path: Optional[str] = None
+    ):
+        """
+        AI 에이전트 초기화
+        
+        Args:
+            api_key: OpenAI API 키 (없으면 OPENAI_API_KEY 환경변수)
+            semantic_cache: True이면 같은 페르소나의 의미상 거의 같은 질문에 대해
+                이전 서베이 응답을 재사용 (질문 임베딩 코사인 유사도 기준)
+            cache_threshold: 캐시 적중으로 판단할 최소 코사인 유사도
+            cache_path: 시맨틱 캐시를 저장/복원할 파일 경로
+            history_maxlen: 응답 히스토리에 보관할 최대 개수 (None이면 제한 없음)
+            history_path: 지정하면 응답 히스토리를 메모리 대신 이 JSONL 파일에 추가 기록
+        """
         if api_key is None:
             api_key = os.getenv('OPENAI_API_KEY')
         
         if not api_key:
             raise ValueError("OpenAI API 키가 필요합니다.")
         
-        self.client = OpenAI(api_key=api_key)
+        # 연결 풀을 공유하는 HTTP 클라이언트 + 일시적 오류 자동 재시도
+        self.client = OpenAI(
+            api_key=api_key,
+            max_retries=MAX_RETRIES,
+            http_client=httpx.Client(limits=HTTP_LIMITS, timeout=HTTP_TIMEOUT)
+        )
+        # 비동기 클라이언트는 연결 풀이 이벤트 루프에 묶이므로 실행마다 async_client()로 생성
+        self._api_key = api_key
         self.model = "gpt-4o-mini"
-        self.response_history = []
+        # 장시간 실행 시 메모리를 제한할 수 있도록 deque 사용 (오래된 항목부터 제거)
+        self.response_history = deque(maxlen=history_maxlen)
+        self.history_path = history_path
+        self._history_fp = open(history_path, 'a', encoding='utf-8', buffering=1 << 16) if history_path else None
+        
+        # 통계용 누적 카운터 (히스토리를 다시 순회하지 않음, 신뢰도는 Welford 방식)
+        self._history_lock = threading.Lock()
+        self._n_total = 0
+        self._n_survey = 0
+        self._n_interview = 0
+        self._conf_cnt = 0
+        self._conf_mean = 0.0
+        self._conf_m2 = 0.0
+        self._pids = set()
+        
+        # 시맨틱 캐시: (페르소나 ID, 질문 형식) 키별 정규화된 임베딩 행렬(N×D)과 응답
+        self.semantic_cache = semantic_cache
+        self.cache_threshold = cache_threshold
+        self.cache_path = cache_path
+        self._cache_vecs: Dict[Tuple, np.ndarray] = {}
+        self._cache_vals: Dict[Tuple, List[Dict[str, Any]]] = {}
+        self._cache_lock = threading.Lock()
+        if semantic_cache and cache_path and os.path.exists(cache_path):
+            self._load_semantic_cache(cache_path)
         
     def generate_enhanced_survey_response(
         self,
@@ -54,13 +269,28 @@ class EnhancedAIAgent:
     ) -> Dict[str, Any]:
         """향상된 서베이 응답 생성"""
         
+        # 시맨틱 캐시 조회 (적중하면 LLM 호출 생략)
+        cache_key = cache_vec = None
+        if self.semantic_cache:
+            cache_key = (persona.id, question_type, tuple(scale_range), tuple(options or ()))
+            try:
+                cache_vec = self._embed(f"{context}\n{question}")
+                cached = self._semantic_cache_lookup(cache_key, cache_vec)
+            except Exception as e:
+                print(f"[WARN] 시맨틱 캐시 조회 실패: {e}")
+                cache_vec = cached = None
+            
+            if cached is not None:
+                self._record_response(persona.id, question, cached)
+                return cached
+        
         # 페르소나 컨텍스트 구축
         persona_context = self._build_enhanced_persona_context(persona)
         
-        # 질문별 맞춤 프롬프트 생성
-        prompt = self._create_enhanced_survey_prompt(
-            persona_context, question, question_type, 
-            scale_range, context, options
+        # 페르소나별 고정 시스템 프롬프트 + 질문별 사용자 프롬프트
+        system_prompt = self._static_system_prompt(persona_context)
+        prompt = self._dynamic_user_prompt(
+            question, question_type, scale_range, context, options
         )
         
         try:
@@ -68,7 +298,7 @@ class EnhancedAIAgent:
             response = self.client.chat.completions.create(
                 model=self.model,
                 messages=[
-                    {"role": "system", "content": "당신은 주어진 페르소나의 특성을 바탕으로 진정성 있는 응답을 생성하는 AI입니다."},
+                    {"role": "system", "content": system_prompt},
                     {"role": "user", "content": prompt}
                 ],
                 temperature=0.7,
@@ -77,48 +307,441 @@ class EnhancedAIAgent:
             
             ai_response = response.choices[0].message.content.strip()
             
-            # 응답 파싱 및 분석
-            parsed_response = self._parse_survey_response(
-                ai_response, question_type, scale_range
+            result = self._build_survey_result(
+                persona, question, ai_response, question_type, scale_range
             )
+            if cache_vec is not None:
+                self._semantic_cache_store(cache_key, cache_vec, result)
             
-            # 메타데이터 생성
-            metadata = self._generate_response_metadata(
-                persona, question, parsed_response, ai_response
-            )
+            return result
             
-            result = {
-                'response': parsed_response['response'],
-                'score': parsed_response.get('score'),
-                'reasoning': parsed_response.get('reasoning', ''),
-                'metadata': metadata,
-                'raw_ai_response': ai_response
+        except OpenAIError as e:
+            # 재시도 후에도 실패한 API 오류만 기본 응답으로 대체 (코드 오류는 그대로 전파)
+            return self._survey_error_result(e, scale_range)
+    
+    def _embed(self, text: str) -> np.ndarray:
+        """텍스트 임베딩을 L2 정규화된 float32 벡터로 반환"""
+        response = self.client.embeddings.create(model=EMBEDDING_MODEL, input=text)
+        vec = np.asarray(response.data[0].embedding, dtype=np.float32)
+        norm = np.linalg.norm(vec)
+        return vec / norm if norm else vec
+    
+    def _semantic_cache_lookup(self, key: Tuple, vec: np.ndarray) -> Optional[Dict[str, Any]]:
+        """유사도가 임계값 이상인 캐시 응답을 타임스탬프만 갱신하여 반환"""
+        vecs = self._cache_vecs.get(key)
+        if vecs is None:
+            return None
+        
+        sims = vecs @ vec
+        best = int(np.argmax(sims))
+        if sims[best] < self.cache_threshold:
+            return None
+        
+        cached = dict(self._cache_vals[key][best])
+        if isinstance(cached.get('metadata'), ResponseMetadata):
+            cached['metadata'] = replace(cached['metadata'], timestamp=datetime.now().isoformat())
+        return cached
+    
+    def _semantic_cache_store(self, key: Tuple, vec: np.ndarray, result: Dict[str, Any]) -> None:
+        """응답을 시맨틱 캐시에 추가"""
+        with self._cache_lock:
+            vecs = self._cache_vecs.get(key)
+            self._cache_vecs[key] = vec[np.newaxis, :] if vecs is None else np.vstack([vecs, vec])
+            self._cache_vals.setdefault(key, []).append(result)
+    
+    def save_semantic_cache(self, path: Optional[str] = None) -> None:
+        """
+        시맨틱 캐시를 파일로 저장 (다음 실행에서 cache_path로 복원)
+        
+        임베딩 벡터는 배열 그대로, 캐시 키와 응답은 JSON 문자열로 하나의 .npz 파일에 저장합니다
+        (pickle을 쓰지 않으므로 로드 시 임의 코드가 실행되지 않음).
+        """
+        path = path or self.cache_path
+        if not path:
+            raise ValueError("캐시 저장 경로가 필요합니다.")
+        
+        with self._cache_lock:
+            keys = list(self._cache_vecs)
+            meta = {
+                'keys': [list(key) for key in keys],
+                'vals': [self._cache_vals[key] for key in keys]
             }
+            arrays = {f"vec_{i}": self._cache_vecs[key] for i, key in enumerate(keys)}
+        
+        meta_json = json.dumps(meta, ensure_ascii=False, default=_json_default)
+        with open(path, 'wb') as f:
+            np.savez(f, meta=np.array(meta_json), **arrays)
+        print(f"[OK] 시맨틱 캐시 저장: {path}")
+    
+    def _load_semantic_cache(self, path: str) -> None:
+        """저장된 시맨틱 캐시 복원 (allow_pickle=False)"""
+        try:
+            with np.load(path, allow_pickle=False) as data:
+                meta = json.loads(str(data['meta']))
+                vecs = {}
+                vals = {}
+                for i, (key, entries) in enumerate(zip(meta['keys'], meta['vals'])):
+                    # JSON에서 리스트로 바뀐 키를 조회에 쓰는 튜플 형태로 복원
+                    persona_id, question_type, scale_range, options = key
+                    key = (persona_id, question_type, tuple(scale_range), tuple(options))
+                    vecs[key] = data[f"vec_{i}"].astype(np.float32, copy=False)
+                    vals[key] = [self._restore_cached_result(entry) for entry in entries]
+            self._cache_vecs = vecs
+            self._cache_vals = vals
+            print(f"[OK] 시맨틱 캐시 로드: {sum(len(v) for v in self._cache_vals.values())}개 응답")
+        except Exception as e:
+            print(f"[WARN] 시맨틱 캐시 로드 실패: {e}")
+    
+    @staticmethod
+    def _restore_cached_result(entry: Dict[str, Any]) -> Dict[str, Any]:
+        """JSON으로 저장된 캐시 응답의 메타데이터를 ResponseMetadata로 되돌림"""
+        metadata = entry.get('metadata')
+        if isinstance(metadata, dict):
+            entry['metadata'] = ResponseMetadata(**metadata)
+        return entry
+    
+    def generate_enhanced_survey_response_batch(
+        self,
+        personas: List[Persona],
+        questions: List[str],
+        question_type: str = "likert",
+        scale_range: Tuple[int, int] = (1, 7),
+        context: str = "",
+        options: List[str] = None,
+        max_concurrency: int = 20,
+        requests_per_minute: Optional[int] = None
+    ) -> List[List[Dict[str, Any]]]:
+        """
+        여러 페르소나 × 질문 조합의 서베이 응답을 비동기로 병렬 생성
+        
+        Returns:
+            results[i][j]: personas[i]의 questions[j]에 대한 응답
+            (generate_enhanced_survey_response와 같은 형식)
+        """
+        return asyncio.run(self.agenerate_enhanced_survey_response_batch(
+            personas, questions, question_type, scale_range, context,
+            options, max_concurrency, requests_per_minute
+        ))
+    
+    async def agenerate_enhanced_survey_response_batch(
+        self,
+        personas: List[Persona],
+        questions: List[str],
+        question_type: str = "likert",
+        scale_range: Tuple[int, int] = (1, 7),
+        context: str = "",
+        options: List[str] = None,
+        max_concurrency: int = 20,
+        requests_per_minute: Optional[int] = None
+    ) -> List[List[Dict[str, Any]]]:
+        """generate_enhanced_survey_response_batch의 비동기 버전 (이미 이벤트 루프가 실행 중일 때 사용)"""
+        semaphore = asyncio.Semaphore(max_concurrency)
+        limiter = None
+        if requests_per_minute:
+            if AsyncLimiter is not None:
+                limiter = AsyncLimiter(requests_per_minute, 60)
+            else:
+                print("[WARN] aiolimiter가 설치되어 있지 않아 분당 요청 수를 제한하지 않습니다.")
+        
+        async def answer(persona: Persona, question: str) -> Dict[str, Any]:
+            system_prompt = self._static_system_prompt(self._build_enhanced_persona_context(persona))
+            prompt = self._dynamic_user_prompt(
+                question, question_type, scale_range, context, options
+            )
             
-            # 응답 히스토리 저장
-            self.response_history.append({
-                'persona_id': persona.id,
-                'question': question,
-                'result': result,
-                'timestamp': datetime.now().isoformat()
-            })
+            try:
+                async with semaphore:
+                    if limiter is not None:
+                        async with limiter:
+                            ai_response = await self._acall(aclient, prompt, system_prompt, 0.7, 500)
+                    else:
+                        ai_response = await self._acall(aclient, prompt, system_prompt, 0.7, 500)
+                
+                return self._build_survey_result(
+                    persona, question, ai_response, question_type, scale_range
+                )
+            except OpenAIError as e:
+                return self._survey_error_result(e, scale_range)
+        
+        # 같은 페르소나의 질문을 연달아 요청해 시스템 프롬프트 캐시 적중률을 높임
+        # 비동기 클라이언트는 이번 이벤트 루프에서 만들고 끝나면 닫음
+        async with self.async_client() as aclient:
+            tasks = [answer(persona, question) for persona in personas for question in questions]
+            flat_results = await asyncio.gather(*tasks, return_exceptions=True)
+        
+        # 예상하지 못한 예외도 단일 호출과 같은 기본 응답으로 변환
+        flat_results = [
+            self._survey_error_result(r, scale_range) if isinstance(r, BaseException) else r
+            for r in flat_results
+        ]
+        
+        n_questions = len(questions)
+        return [
+            flat_results[i * n_questions:(i + 1) * n_questions]
+            for i in range(len(personas))
+        ]
+    
+    def generate_enhanced_survey_response_pool(
+        self,
+        tasks: List[Dict[str, Any]],
+        max_workers: int = 16
+    ) -> List[Dict[str, Any]]:
+        """
+        동기 호출자를 위한 스레드 풀 병렬 서베이 응답 생성
+        
+        OpenAI 호출은 HTTP 대기 중 GIL을 놓으므로 asyncio 없이도 요청을 겹쳐 보낼 수 있습니다.
+        
+        Args:
+            tasks: generate_enhanced_survey_response 키워드 인자 딕셔너리 리스트
+                (예: {'persona': persona, 'question': "...", 'question_type': "likert"})
+            max_workers: 동시에 실행할 최대 요청 수
+        
+        Returns:
+            tasks와 같은 순서의 응답 리스트
+        """
+        if not tasks:
+            return []
+        
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(tasks))) as executor:
+            # map은 완료 순서와 관계없이 입력 순서대로 결과를 반환
+            return list(executor.map(lambda task: self.generate_enhanced_survey_response(**task), tasks))
+    
+    def generate_survey_responses_batched_offline(
+        self,
+        tasks: List[Tuple[Persona, str]],
+        question_type: str = "likert",
+        scale_range: Tuple[int, int] = (1, 7),
+        context: str = "",
+        options: List[str] = None,
+        poll_interval: float = 30.0
+    ) -> List[Dict[str, Any]]:
+        """
+        대량의 (페르소나, 질문) 조합을 OpenAI Batch API로 처리
+        
+        요청을 JSONL 파일 하나로 업로드하고 배치가 끝날 때까지 폴링합니다.
+        지연 시간은 길지만(최대 24시간) 요청당 비용이 낮아 오프라인 대량 시뮬레이션에 적합합니다.
+        
+        Returns:
+            tasks와 같은 순서의 응답 리스트 (generate_enhanced_survey_response와 같은 형식)
+        """
+        if not tasks:
+            return []
+        
+        # 모든 작업의 페르소나 컨텍스트를 한 번에 생성
+        personas = [persona for persona, _ in tasks]
+        persona_contexts = self._persona_context_batch(
+            np.array([self._norm_pid(p.id) for p in personas], dtype=np.int64),
+            [self._persona_summary(p) for p in personas]
+        )
+        
+        # 1. 요청 JSONL 작성 (custom_id = tasks 인덱스)
+        with tempfile.NamedTemporaryFile('w', suffix='.jsonl', encoding='utf-8', delete=False) as f:
+            batch_path = f.name
+            for i, (persona, question) in enumerate(tasks):
+                system_prompt = self._static_system_prompt(persona_contexts[i])
+                prompt = self._dynamic_user_prompt(
+                    question, question_type, scale_range, context, options
+                )
+                f.write(json.dumps({
+                    'custom_id': str(i),
+                    'method': 'POST',
+                    'url': '/v1/chat/completions',
+                    'body': {
+                        'model': self.model,
+                        'messages': [
+                            {"role": "system", "content": system_prompt},
+                            {"role": "user", "content": prompt}
+                        ],
+                        'temperature': 0.7,
+                        'max_tokens': 500
+                    }
+                }, ensure_ascii=False) + '\n')
+        
+        # 2. 업로드 및 배치 생성
+        try:
+            with open(batch_path, 'rb') as f:
+                input_file = self.client.files.create(file=f, purpose="batch")
+        finally:
+            os.remove(batch_path)
+        
+        batch = self.client.batches.create(
+            input_file_id=input_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h"
+        )
+        print(f"[INFO] Batch submitted: {batch.id} ({len(tasks)} requests)")
+        
+        # 3. 완료될 때까지 폴링
+        while batch.status not in ("completed", "failed", "expired", "cancelled"):
+            time.sleep(poll_interval)
+            batch = self.client.batches.retrieve(batch.id)
+        
+        if batch.status != "completed" or not batch.output_file_id:
+            error = RuntimeError(f"Batch {batch.id} ended with status: {batch.status}")
+            print(f"[ERROR] {error}")
+            return [self._survey_error_result(error, scale_range) for _ in tasks]
+        
+        # 4. 결과 파일 파싱 (custom_id -> 응답 본문)
+        responses = {}
+        for line in self.client.files.content(batch.output_file_id).text.splitlines():
+            if not line.strip():
+                continue
+            item = json.loads(line)
+            response = item.get('response') or {}
+            if response.get('status_code') == 200:
+                responses[item['custom_id']] = response['body']['choices'][0]['message']['content'].strip()
+            else:
+                responses[item['custom_id']] = RuntimeError(str(item.get('error') or response))
+        
+        results = []
+        for i, (persona, question) in enumerate(tasks):
+            ai_response = responses.get(str(i), RuntimeError("Batch output missing for request"))
+            if isinstance(ai_response, Exception):
+                results.append(self._survey_error_result(ai_response, scale_range))
+            else:
+                results.append(self._build_survey_result(
+                    persona, question, ai_response, question_type, scale_range
+                ))
+        
+        return results
+    
+    def async_client(self) -> AsyncOpenAI:
+        """
+        비동기 요청용 클라이언트를 새로 생성 (연결 풀 설정과 재시도는 동기 클라이언트와 동일)
+        
+        연결 풀이 처음 사용한 이벤트 루프에 묶이므로 asyncio.run 한 번마다
+        코루틴 안에서 `async with self.async_client() as aclient:`로 만들어 사용합니다.
+        """
+        return AsyncOpenAI(
+            api_key=self._api_key,
+            max_retries=MAX_RETRIES,
+            http_client=httpx.AsyncClient(limits=HTTP_LIMITS, timeout=HTTP_TIMEOUT)
+        )
+    
+    async def _acall(
+        self,
+        aclient: AsyncOpenAI,
+        prompt: str,
+        system: str,
+        temperature: float,
+        max_tokens: int
+    ) -> str:
+        """비동기 클라이언트로 단일 chat completion 호출"""
+        response = await aclient.chat.completions.create(
+            model=self.model,
+            messages=[
+                {"role": "system", "content": system},
+                {"role": "user", "content": prompt}
+            ],
+            temperature=temperature,
+            max_tokens=max_tokens
+        )
+        return response.choices[0].message.content.strip()
+    
+    def _build_survey_result(
+        self,
+        persona: Persona,
+        question: str,
+        ai_response: str,
+        question_type: str,
+        scale_range: Tuple[int, int]
+    ) -> Dict[str, Any]:
+        """AI 응답을 파싱하여 서베이 결과를 만들고 히스토리에 저장"""
+        # 응답 파싱 및 분석
+        parsed_response = self._parse_survey_response(
+            ai_response, question_type, scale_range
+        )
+        
+        # 메타데이터 생성
+        metadata = self._generate_response_metadata(
+            persona, question, parsed_response, ai_response
+        )
+        
+        result = {
+            'response': parsed_response['response'],
+            'score': parsed_response.get('score'),
+            'reasoning': parsed_response.get('reasoning', ''),
+            'metadata': metadata,
+            'raw_ai_response': ai_response
+        }
+        
+        # 응답 히스토리 저장
+        self._record_response(persona.id, question, result)
+        
+        return result
+    
+    def _record_response(self, persona_id: str, question: Any, result: Dict[str, Any]) -> None:
+        """응답을 히스토리(메모리 또는 JSONL)에 저장하고 통계 카운터를 갱신 (스레드 안전)"""
+        entry = {
+            'persona_id': persona_id,
+            'question': question,
+            'result': result,
+            'timestamp': datetime.now().isoformat()
+        }
+        line = None
+        if self._history_fp is not None:
+            line = json.dumps(entry, ensure_ascii=False, default=_json_default) + '\n'
+        
+        metadata = result.get('metadata')
+        
+        with self._history_lock:
+            if line is not None:
+                self._history_fp.write(line)
+            else:
+                self.response_history.append(entry)
             
-            return result
+            self._n_total += 1
+            self._pids.add(persona_id)
+            if 'score' in result:
+                self._n_survey += 1
+            if 'conversation' in result:
+                self._n_interview += 1
             
-        except Exception as e:
-            return {
-                'response': f"응답 생성 오류: {str(e)}",
-                'score': scale_range[0] + (scale_range[1] - scale_range[0]) // 2,  # 중간값
-                'reasoning': "시스템 오류로 인한 기본 응답",
-                'metadata': ResponseMetadata(
-                    confidence=0.0,
-                    reasoning="오류 발생",
-                    persona_traits_used=[],
-                    response_style="기본",
-                    timestamp=datetime.now().isoformat()
-                ),
-                'error': str(e)
-            }
+            if hasattr(metadata, 'confidence'):
+                self._conf_cnt += 1
+                delta = metadata.confidence - self._conf_mean
+                self._conf_mean += delta / self._conf_cnt
+                self._conf_m2 += delta * (metadata.confidence - self._conf_mean)
+    
+    def iter_history(self) -> Iterator[Dict[str, Any]]:
+        """
+        전체 응답 히스토리를 순회
+        
+        history_path를 사용하는 경우 JSONL 파일을 한 줄씩 읽으며,
+        이때 metadata는 ResponseMetadata가 아닌 dict로 반환됩니다.
+        """
+        if self._history_fp is None:
+            yield from self.response_history
+            return
+        
+        self._history_fp.flush()
+        with open(self.history_path, 'r', encoding='utf-8') as f:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+    
+    def close(self) -> None:
+        """히스토리 파일과 동기 HTTP 연결 풀을 닫음 (비동기 클라이언트는 실행마다 생성·종료됨)"""
+        if self._history_fp is not None:
+            self._history_fp.close()
+            self._history_fp = None
+        self.client.close()
+    
+    def _survey_error_result(self, e: BaseException, scale_range: Tuple[int, int]) -> Dict[str, Any]:
+        """서베이 응답 생성 실패 시 기본 응답"""
+        return {
+            'response': f"응답 생성 오류: {str(e)}",
+            'score': scale_range[0] + (scale_range[1] - scale_range[0]) // 2,  # 중간값
+            'reasoning': "시스템 오류로 인한 기본 응답",
+            'metadata': ResponseMetadata(
+                confidence=0.0,
+                reasoning="오류 발생",
+                persona_traits_used=[],
+                response_style="기본",
+                timestamp=datetime.now().isoformat()
+            ),
+            'error': str(e)
+        }
     
     def generate_enhanced_interview_response(
         self,
@@ -131,16 +754,17 @@ class EnhancedAIAgent:
         
         persona_context = self._build_enhanced_persona_context(persona)
         
-        # 인터뷰 프롬프트 생성
-        prompt = self._create_enhanced_interview_prompt(
-            persona_context, interview_questions, interview_style, context
+        # 인터뷰 프롬프트 생성 (페르소나 블록은 시스템 프롬프트로 분리)
+        system_prompt = self._static_interview_system_prompt(persona_context)
+        prompt = self._dynamic_interview_prompt(
+            interview_questions, interview_style, context
         )
         
         try:
             response = self.client.chat.completions.create(
                 model=self.model,
                 messages=[
-                    {"role": "system", "content": "당신은 주어진 페르소나의 특성을 바탕으로 자연스럽고 진정성 있는 인터뷰 응답을 생성하는 AI입니다."},
+                    {"role": "system", "content": system_prompt},
                     {"role": "user", "content": prompt}
                 ],
                 temperature=0.8,
@@ -165,9 +789,12 @@ class EnhancedAIAgent:
                 'raw_ai_response': ai_response
             }
             
+            # 응답 히스토리 저장
+            self._record_response(persona.id, interview_questions, result)
+            
             return result
             
-        except Exception as e:
+        except OpenAIError as e:
             return {
                 'conversation': f"인터뷰 응답 생성 오류: {str(e)}",
                 'metadata': ResponseMetadata(
@@ -182,14 +809,35 @@ class EnhancedAIAgent:
     
     def _build_enhanced_persona_context(self, persona: Persona) -> str:
         """향상된 페르소나 컨텍스트 구축"""
-        persona_id = int(persona.id) if persona.id.isdigit() else hash(persona.id) % 1000
-        
+        return self._persona_context(self._norm_pid(persona.id), self._persona_summary(persona))
+    
+    @staticmethod
+    @lru_cache(maxsize=8192)
+    def _norm_pid(persona_id: str) -> int:
+        """페르소나 ID를 특성 선택용 정수로 변환 (숫자가 아니면 해시 기반 0-999)"""
+        return int(persona_id) if persona_id.isdigit() else hash(persona_id) % 1000
+    
+    @staticmethod
+    def _persona_summary(persona: Persona) -> str:
+        """컨텍스트에 포함할 개인 배경 요약 (최대 200자, 없으면 빈 문자열)"""
+        # 기존 데이터 활용
+        summary = ""
+        if 'persona_summary' in persona.data and persona.data['persona_summary']:
+            summary = str(persona.data['persona_summary'])
+            if len(summary) > 200:
+                summary = summary[:200] + "..."
+        return summary
+    
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _persona_context(persona_id: int, summary: str) -> str:
+        """페르소나 ID와 요약으로 컨텍스트 문자열 생성 (같은 페르소나는 캐시된 문자열 재사용)"""
         # 다차원 특성 매핑
-        demographics = self._get_enhanced_demographics(persona_id)
-        personality = self._get_enhanced_personality(persona_id)
-        preferences = self._get_enhanced_preferences(persona_id)
-        experiences = self._get_enhanced_experiences(persona_id)
-        values = self._get_enhanced_values(persona_id)
+        demographics = EnhancedAIAgent._get_enhanced_demographics(persona_id)
+        personality = EnhancedAIAgent._get_enhanced_personality(persona_id)
+        preferences = EnhancedAIAgent._get_enhanced_preferences(persona_id)
+        experiences = EnhancedAIAgent._get_enhanced_experiences(persona_id)
+        values = EnhancedAIAgent._get_enhanced_values(persona_id)
         
         context_parts = [
             f"인구통계: {demographics}",
@@ -199,174 +847,181 @@ class EnhancedAIAgent:
             f"가치관: {values}"
         ]
         
-        # 기존 데이터 활용
-        if 'persona_summary' in persona.data and persona.data['persona_summary']:
-            summary = str(persona.data['persona_summary'])
-            if len(summary) > 200:
-                summary = summary[:200] + "..."
+        if summary:
             context_parts.append(f"개인 배경: {summary}")
         
         return "\n".join(context_parts)
     
-    def _get_enhanced_demographics(self, persona_id: int) -> str:
+    @staticmethod
+    def _get_enhanced_demographics(persona_id: int) -> str:
         """향상된 인구통계 정보"""
-        age_groups = ["20대 초반", "20대 후반", "30대 초반", "30대 후반", "40대 초반", "40대 후반", "50대", "60대"]
-        genders = ["남성", "여성", "기타"]
-        regions = ["서울", "경기", "부산", "대구", "광주", "대전", "울산", "세종", "기타"]
-        educations = ["고졸", "대졸", "대학원", "박사"]
-        incomes = ["저소득", "중소득", "고소득", "최고소득"]
-        occupations = ["사무직", "IT개발자", "마케터", "교사", "의사", "예술가", "판매원", "자영업자", "연구원", "디자이너"]
-        
-        return f"{age_groups[persona_id % len(age_groups)]}, {genders[persona_id % len(genders)]}, {regions[persona_id % len(regions)]}, {educations[persona_id % len(educations)]}, {incomes[persona_id % len(incomes)]}, {occupations[persona_id % len(occupations)]}"
+        return f"{AGE_GROUPS[persona_id % len(AGE_GROUPS)]}, {GENDERS[persona_id % len(GENDERS)]}, {REGIONS[persona_id % len(REGIONS)]}, {EDUCATIONS[persona_id % len(EDUCATIONS)]}, {INCOMES[persona_id % len(INCOMES)]}, {OCCUPATIONS[persona_id % len(OCCUPATIONS)]}"
     
-    def _get_enhanced_personality(self, persona_id: int) -> str:
+    @staticmethod
+    def _get_enhanced_personality(persona_id: int) -> str:
         """향상된 성격 특성"""
-        primary_traits = [
-            "외향적이고 사교적", "내향적이고 신중", "창의적이고 개방적", 
-            "체계적이고 완벽주의", "낙천적이고 유연", "분석적이고 논리적", 
-            "감성적이고 직관적", "경쟁적이고 야심적"
-        ]
-        
-        secondary_traits = [
-            "협력적", "독립적", "혁신적", "전통적", "모험적", "안정적", 
-            "이상주의적", "현실적"
-        ]
-        
-        primary = primary_traits[persona_id % len(primary_traits)]
-        secondary = secondary_traits[(persona_id + 1) % len(secondary_traits)]
+        primary = PRIMARY_TRAITS[persona_id % len(PRIMARY_TRAITS)]
+        secondary = SECONDARY_TRAITS[(persona_id + 1) % len(SECONDARY_TRAITS)]
         
         return f"{primary}, {secondary}"
     
-    def _get_enhanced_preferences(self, persona_id: int) -> str:
+    @staticmethod
+    def _get_enhanced_preferences(persona_id: int) -> str:
         """향상된 선호도 - 일관성 있는 브랜드 선호도 생성"""
-        # ID 기반으로 일관성 있는 선호도 생성
-        tech_prefs = ["애플 매니아", "삼성 팬", "구글 픽셀 선호", "중립적", "가성비 중시", "최신 기술 추구", "브랜드 무관심", "안정성 중시"]
-        spending = ["극도 절약형", "절약형", "적당형", "소비형", "프리미엄형", "럭셔리형"]
-        lifestyles = ["미니멀", "활동적", "편안함 추구", "도전적", "전통적", "혁신적"]
-        
         # 브랜드 충성도와 기술 선호도를 연관시켜 일관성 확보
         brand_loyalty_level = persona_id % 4  # 0-3
+        brands = BRAND_LOYALTY_LABELS[brand_loyalty_level]
+        tech_pref = TECH_PREF_BY_LOYALTY[brand_loyalty_level][persona_id % LOYALTY_TECH_WIDTHS[brand_loyalty_level]]
         
-        if brand_loyalty_level == 0:  # 높은 충성도
-            brands = "브랜드 충성도 높음 (특정 브랜드 선호)"
-            tech_pref = tech_prefs[persona_id % 3]  # 애플, 삼성, 구글 중 선택
-        elif brand_loyalty_level == 1:  # 보통 충성도
-            brands = "브랜드 충성도 보통 (선호 브랜드 있음)"
-            tech_pref = tech_prefs[3 + (persona_id % 3)]  # 중립적, 가성비, 최신기술 중 선택
-        elif brand_loyalty_level == 2:  # 낮은 충성도
-            brands = "브랜드 충성도 낮음 (브랜드 무관심)"
-            tech_pref = tech_prefs[6 + (persona_id % 2)]  # 브랜드 무관심, 안정성 중 선택
-        else:  # 무관심
-            brands = "브랜드 완전 무관심 (기능만 중시)"
-            tech_pref = "기능 중심"
-        
-        spending_style = spending[persona_id % len(spending)]
-        lifestyle = lifestyles[persona_id % len(lifestyles)]
+        spending_style = SPENDING_STYLES[persona_id % len(SPENDING_STYLES)]
+        lifestyle = PREFERENCE_LIFESTYLES[persona_id % len(PREFERENCE_LIFESTYLES)]
         
         return f"기술: {tech_pref}, 소비: {spending_style}, 브랜드: {brands}, 라이프스타일: {lifestyle}"
     
-    def _get_enhanced_experiences(self, persona_id: int) -> str:
+    @staticmethod
+    def _get_enhanced_experiences(persona_id: int) -> str:
         """향상된 경험 배경"""
-        careers = ["신입", "경력 3-5년", "경력 10년+", "전문가", "리더", "은퇴"]
-        industries = ["IT", "금융", "제조", "서비스", "교육", "의료", "예술", "스포츠", "정부", "비영리"]
-        lifestyles = ["싱글", "커플", "가족", "대가족", "독신", "동거"]
-        interests = ["기술", "예술", "스포츠", "여행", "독서", "음악", "게임", "요리", "사진", "운동"]
-        
-        return f"경력: {careers[persona_id % len(careers)]}, 업계: {industries[persona_id % len(industries)]}, 라이프스타일: {lifestyles[persona_id % len(lifestyles)]}, 관심사: {interests[persona_id % len(interests)]}"
+        return f"경력: {CAREERS[persona_id % len(CAREERS)]}, 업계: {INDUSTRIES[persona_id % len(INDUSTRIES)]}, 라이프스타일: {HOUSEHOLDS[persona_id % len(HOUSEHOLDS)]}, 관심사: {INTERESTS[persona_id % len(INTERESTS)]}"
     
-    def _get_enhanced_values(self, persona_id: int) -> str:
+    @staticmethod
+    def _get_enhanced_values(persona_id: int) -> str:
         """향상된 가치관"""
-        values = [
-            "성공과 성취", "가족과 관계", "자유와 독립", "안정과 보안", 
-            "창의와 혁신", "전통과 질서", "평등과 정의", "개인적 성장"
-        ]
-        
-        primary_value = values[persona_id % len(values)]
-        secondary_value = values[(persona_id + 2) % len(values)]
+        primary_value = CORE_VALUES[persona_id % len(CORE_VALUES)]
+        secondary_value = CORE_VALUES[(persona_id + 2) % len(CORE_VALUES)]
         
         return f"{primary_value}, {secondary_value}"
     
-    def _create_enhanced_survey_prompt(
+    @staticmethod
+    def _persona_context_batch(persona_ids: np.ndarray, summaries: Optional[List[str]] = None) -> np.ndarray:
+        """
+        여러 페르소나의 컨텍스트를 한 번에 생성 (_persona_context와 같은 문자열)
+        
+        특성별로 테이블을 인덱스 배열로 선택한 뒤 object 배열 단위로 이어 붙입니다.
+        Batch API처럼 많은 페르소나의 프롬프트를 만드는 경로에서 사용합니다.
+        """
+        ids = np.asarray(persona_ids, dtype=np.int64)
+        
+        # 특성별 인덱스를 한 번에 계산한 뒤 테이블에서 열 단위로 선택
+        idx = _pick_trait_indices(ids, _TRAIT_LENS, _TRAIT_OFFSETS)
+        (age, gender, region, education, income, occupation,
+         primary, secondary, spending, lifestyle,
+         career, industry, household, interest,
+         primary_value, secondary_value) = (
+            table[idx[:, j]] for j, table in enumerate(_TRAIT_ARRAYS)
+        )
+        brands = _BRAND_LOYALTY_ARRAY[idx[:, -2]]
+        tech_prefs = _TECH_PREF_ARRAY[idx[:, -1]]
+        
+        demographics = (
+            age + ", " + gender + ", " + region + ", "
+            + education + ", " + income + ", " + occupation
+        )
+        personality = primary + ", " + secondary
+        preferences = (
+            "기술: " + tech_prefs + ", 소비: " + spending
+            + ", 브랜드: " + brands + ", 라이프스타일: " + lifestyle
+        )
+        experiences = (
+            "경력: " + career + ", 업계: " + industry
+            + ", 라이프스타일: " + household + ", 관심사: " + interest
+        )
+        values = primary_value + ", " + secondary_value
+        
+        contexts = (
+            "인구통계: " + demographics + "\n성격 특성: " + personality
+            + "\n선호도: " + preferences + "\n경험 배경: " + experiences
+            + "\n가치관: " + values
+        )
+        
+        if summaries is not None:
+            for i, summary in enumerate(summaries):
+                if summary:
+                    contexts[i] = f"{contexts[i]}\n개인 배경: {summary}"
+        
+        return contexts
+    
+    def _static_system_prompt(self, persona_context: str) -> str:
+        """
+        서베이 시스템 프롬프트 (페르소나별로 고정)
+        
+        페르소나 블록을 질문과 분리해 같은 페르소나의 연속 호출에서
+        OpenAI 프롬프트 캐싱이 앞부분을 재사용할 수 있게 합니다.
+        """
+        return f"""{SURVEY_SYSTEM_PROMPT}
+
+당신은 {persona_context} 특성을 가진 실제 사람입니다.
+
+지침:
+1. 당신의 성격, 경험, 가치관에서 나온 고유한 관점으로 답변 (다른 사람과 같은 답변 금지)
+2. 특성과 일관되게 답변 (예: 브랜드 충성도가 높으면 높은 점수, 낮으면 낮은 점수)
+"""
+    
+    def _dynamic_user_prompt(
         self,
-        persona_context: str,
         question: str,
         question_type: str,
         scale_range: Tuple[int, int],
         context: str,
         options: List[str] = None
     ) -> str:
-        """향상된 서베이 프롬프트 생성"""
+        """질문별 서베이 사용자 프롬프트 생성"""
         
         base_prompt = f"""
-당신은 {persona_context} 특성을 가진 실제 사람입니다.
-
 컨텍스트: {context}
 
 질문: {question}
-
-중요한 지침:
-1. 당신의 고유한 성격, 경험, 가치관을 바탕으로 답변하세요
-2. 다른 사람과 똑같은 답변을 하지 마세요
-3. 당신만의 개별적인 관점과 경험을 반영하세요
-4. 일관성 있게 답변하세요 (예: 브랜드 충성도가 높으면 높은 점수, 낮으면 낮은 점수)
 """
         
         if question_type == "likert":
             scale_min, scale_max = scale_range
             base_prompt += f"""
 
-{scale_min}점(전혀 동의하지 않음)부터 {scale_max}점(완전히 동의함)까지의 척도로 답변해주세요.
-
-당신의 브랜드 선호도, 소비 성향, 기술 수준에 따라 일관성 있게 점수를 선택하세요:
-- 브랜드 충성도가 높으면 높은 점수 (5-7점)
-- 브랜드 충성도가 낮으면 낮은 점수 (1-4점)
-- 브랜드 무관심이면 중간 점수 (3-5점)
+{scale_min}점(전혀 동의하지 않음)~{scale_max}점(완전히 동의함) 척도로 답변하세요.
+브랜드 선호도·소비 성향·기술 수준에 맞게: 충성도 높음 5-7점 / 낮음 1-4점 / 무관심 3-5점
 
 응답 형식:
-점수: [1-7 사이의 숫자]
-이유: [당신만의 구체적인 이유와 개인적 경험]
+점수: [{scale_min}-{scale_max} 사이의 숫자]
+이유: [구체적인 이유와 개인적 경험]
 """
         
         elif question_type == "multiple_choice":
             if options:
                 base_prompt += f"""
 
-다음 선택지 중에서 당신의 개인적 경험과 선호도를 바탕으로 가장 적합한 것을 선택해주세요:
+당신의 경험과 선호도에 가장 맞는 선택지를 고르고 이유를 설명하세요:
 {chr(10).join([f"- {opt}" for opt in options])}
-
-당신의 고유한 특성과 경험을 바탕으로 선택하고 그 이유를 설명해주세요.
 """
         
         elif question_type == "open_ended":
             base_prompt += """
 
-자유롭게 답변해주세요. 당신의 개인적인 경험, 의견, 감정을 포함하여 진정성 있고 고유한 답변을 해주세요.
+개인적인 경험, 의견, 감정을 담아 자유롭게 답변하세요.
 """
         
         return base_prompt
     
-    def _create_enhanced_interview_prompt(
+    def _static_interview_system_prompt(self, persona_context: str) -> str:
+        """인터뷰 시스템 프롬프트 (페르소나별로 고정)"""
+        return f"""{INTERVIEW_SYSTEM_PROMPT}
+
+당신은 {persona_context} 특성을 가진 사람입니다.
+개인적인 경험, 의견, 감정을 담아 실제 사람처럼 답변하세요.
+"""
+    
+    def _dynamic_interview_prompt(
         self,
-        persona_context: str,
         questions: List[str],
         interview_style: str,
         context: str
     ) -> str:
-        """향상된 인터뷰 프롬프트 생성"""
+        """인터뷰 질문별 사용자 프롬프트 생성"""
         
         return f"""
-당신은 {persona_context} 특성을 가진 사람입니다.
-
 인터뷰 컨텍스트: {context}
 인터뷰 스타일: {interview_style}
 
-다음 질문들에 대해 자연스럽고 진정성 있는 답변을 해주세요. 
-당신의 개인적인 경험, 의견, 감정을 포함하여 실제 사람처럼 답변해주세요.
-
-질문들:
+다음 질문들에 각각 구체적이고 자연스럽게 답변하세요:
 {chr(10).join([f"{i+1}. {q}" for i, q in enumerate(questions)])}
-
-각 질문에 대해 구체적이고 개인적인 답변을 해주세요.
 """
     
     def _parse_survey_response(
@@ -378,19 +1033,31 @@ class EnhancedAIAgent:
         """서베이 응답 파싱"""
         
         if question_type == "likert":
+            # 표준 형식이고 다른 곳(이유 본문 포함)에 점수/이유 표시가 없으면 한 번의 매치로 처리
+            m = LIKERT_RE.search(ai_response)
+            if m:
+                prefix = ai_response[:m.start()]
+                tail = ai_response[m.start('reason'):]
+                if not any(label in prefix or label in tail for label in ('점수:', '이유:')):
+                    score = max(scale_range[0], min(scale_range[1], int(m['score'])))  # 범위 제한
+                    return {
+                        'response': (prefix + tail).strip(),
+                        'score': score,
+                        'reasoning': m['reason'].strip()
+                    }
+            
             # 점수 추출
             score = None
             reasoning = ""
             
             # "점수: X" 패턴 찾기
-            import re
-            score_match = re.search(r'점수:\s*(\d+)', ai_response)
+            score_match = SCORE_RE.search(ai_response)
             if score_match:
                 score = int(score_match.group(1))
                 score = max(scale_range[0], min(scale_range[1], score))  # 범위 제한
             
             # 이유 추출
-            reason_match = re.search(r'이유:\s*(.+)', ai_response)
+            reason_match = REASON_RE.search(ai_response)
             if reason_match:
                 reasoning = reason_match.group(1).strip()
             else:
@@ -399,11 +1066,8 @@ class EnhancedAIAgent:
             # 중복 제거를 위해 점수와 이유 부분을 제거한 응답 생성
             clean_response = ai_response
             if score_match and reason_match:
-                # "점수: X" 부분 제거
-                clean_response = re.sub(r'점수:\s*\d+\s*\n?', '', clean_response)
-                # "이유:" 부분 제거
-                clean_response = re.sub(r'이유:\s*', '', clean_response)
-                clean_response = clean_response.strip()
+                # "점수: X"와 "이유:" 부분 제거
+                clean_response = LABEL_STRIP_RE.sub('', clean_response).strip()
             
             return {
                 'response': clean_response,
@@ -478,21 +1142,20 @@ class EnhancedAIAgent:
         confidence = 0.3  # 기본값 (더 낮게 시작)
         
         # 응답 길이
-        if len(response) > 50:
+        L = len(response)
+        if L > 50:
             confidence += 0.1
-        if len(response) > 100:
+        if L > 100:
             confidence += 0.1
-        if len(response) > 200:
+        if L > 200:
             confidence += 0.1
         
         # 개인적 표현 포함
-        personal_indicators = ["개인적으로", "저는", "제 경험", "저의", "나의", "저에게", "제가", "저는"]
-        personal_count = sum(1 for indicator in personal_indicators if indicator in response)
+        personal_count = _count_present(PERSONAL_RE, _PERSONAL_IMPLIED, response)
         confidence += personal_count * 0.05
         
         # 구체적 이유 포함
-        reason_indicators = ["이유", "때문에", "왜냐하면", "왜냐하면", "그래서", "따라서", "때문"]
-        reason_count = sum(1 for indicator in reason_indicators if indicator in response)
+        reason_count = _count_present(REASON_INDICATOR_RE, _REASON_IMPLIED, response)
         confidence += reason_count * 0.03
         
         # 구체적인 내용 포함
@@ -532,43 +1195,38 @@ class EnhancedAIAgent:
     
     def _analyze_response_style(self, response: str) -> str:
         """응답 스타일 분석"""
-        if len(response) < 50:
+        L = len(response)
+        if L < 50:
             return "간결함"
-        elif len(response) > 300:
+        elif L > 300:
             return "상세함"
-        elif "감정" in response or "느낌" in response or "좋아" in response or "싫어" in response:
-            return "감성적"
-        elif "분석" in response or "논리" in response or "데이터" in response or "통계" in response:
-            return "분석적"
-        elif "경험" in response or "사용" in response or "구매" in response:
-            return "경험적"
-        elif "기술" in response or "기능" in response or "성능" in response:
-            return "기술적"
-        else:
-            return "균형적"
+        
+        # 한 번의 스캔으로 등장한 키워드 중 우선순위가 가장 높은 스타일 선택
+        best_group = None
+        for match in STYLE_RE.finditer(response):
+            group = match.lastgroup
+            if best_group is None or _STYLE_PRIORITY[group] < _STYLE_PRIORITY[best_group]:
+                best_group = group
+                if _STYLE_PRIORITY[group] == 0:
+                    break
+        
+        return STYLE_LABELS[best_group] if best_group else "균형적"
     
     def get_response_statistics(self) -> Dict[str, Any]:
-        """응답 통계 반환"""
-        if not self.response_history:
+        """응답 통계 반환 (누적 카운터 기반)"""
+        if not self._n_total:
             return {"total_responses": 0}
         
-        total_responses = len(self.response_history)
-        unique_personas = len(set(r['persona_id'] for r in self.response_history))
-        
-        # 신뢰도 통계
-        confidences = []
-        for response in self.response_history:
-            if 'metadata' in response['result'] and hasattr(response['result']['metadata'], 'confidence'):
-                confidences.append(response['result']['metadata'].confidence)
-        
-        avg_confidence = np.mean(confidences) if confidences else 0.0
-        
-        return {
-            "total_responses": total_responses,
-            "unique_personas": unique_personas,
-            "average_confidence": avg_confidence,
-            "response_types": {
-                "survey": len([r for r in self.response_history if 'score' in r['result']]),
-                "interview": len([r for r in self.response_history if 'conversation' in r['result']])
+        with self._history_lock:
+            conf_std = (self._conf_m2 / self._conf_cnt) ** 0.5 if self._conf_cnt else 0.0
+            
+            return {
+                "total_responses": self._n_total,
+                "unique_personas": len(self._pids),
+                "average_confidence": self._conf_mean,
+                "confidence_std": conf_std,
+                "response_types": {
+                    "survey": self._n_survey,
+                    "interview": self._n_interview
+                }
             }
-        }
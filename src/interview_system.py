@@ -3,9 +3,12 @@
 디지털 트윈들에게 개방형 질문을 하고 자유로운 응답을 수집합니다.
 """
 
+import os
 import json
-import time
-from typing import List, Dict, Any, Optional
+import asyncio
+from functools import lru_cache
+from dataclasses import dataclass, field, asdict
+from typing import List, Dict, Any, Optional, Callable, Iterator
 from datetime import datetime
 from rich.console import Console
 from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TaskProgressColumn
@@ -15,39 +18,133 @@ from rich import box
 from src.dataset_loader import Persona
 from src.ai_agent import AIAgent
 
+# orjson이 설치되어 있으면 더 빠른 직렬화를 사용하고, 없으면 표준 json으로 대체
+try:
+    import orjson
+    
+    def _dumps(obj: Any) -> bytes:
+        return orjson.dumps(
+            obj,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        )
+    
+    def _dumps_line(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY) + b"\n"
+    
+    _loads = orjson.loads
+except ImportError:
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj, ensure_ascii=False, indent=2).encode('utf-8')
+    
+    def _dumps_line(obj: Any) -> bytes:
+        return json.dumps(obj, ensure_ascii=False).encode('utf-8') + b"\n"
+    
+    _loads = json.loads
 
-class InterviewQuestion:
-    """인터뷰 질문 클래스"""
+# 인터뷰 가이드 파일 스키마
+# msgspec이 설치되어 있으면 JSON을 타입 검증과 함께 구조체로 바로 디코딩하고,
+# 없으면 같은 형태의 데이터 클래스로 변환
+try:
+    import msgspec
     
-    def __init__(
-        self,
-        question_id: str,
-        text: str,
-        category: Optional[str] = None,
+    class QuestionSchema(msgspec.Struct, frozen=True):
+        text: str
+        question_id: Optional[str] = None
+        category: Optional[str] = None
+        context: Optional[str] = None
+    
+    class GuideSchema(msgspec.Struct, frozen=True):
+        title: str
+        questions: List[QuestionSchema]
+        description: str = ""
+    
+    _guide_decoder = msgspec.json.Decoder(GuideSchema)
+    
+    def _decode_guide(raw: bytes) -> GuideSchema:
+        try:
+            return _guide_decoder.decode(raw)
+        except msgspec.ValidationError:
+            # null 설명, 숫자 question_id 등 스키마보다 느슨한 기존 가이드 파일은
+            # 이전과 같이 딕셔너리에서 그대로 변환
+            return _guide_from_dict(_loads(raw))
+except ImportError:
+    @dataclass(slots=True, frozen=True)
+    class QuestionSchema:
+        text: str
+        question_id: Optional[str] = None
+        category: Optional[str] = None
         context: Optional[str] = None
-    ):
-        self.question_id = question_id
-        self.text = text
-        self.category = category
-        self.context = context
+    
+    @dataclass(slots=True, frozen=True)
+    class GuideSchema:
+        title: str
+        questions: List[QuestionSchema]
+        description: str = ""
+    
+    def _decode_guide(raw: bytes) -> GuideSchema:
+        return _guide_from_dict(_loads(raw))
+
+
+def _guide_from_dict(data: Dict[str, Any]) -> GuideSchema:
+    """파싱된 가이드 딕셔너리를 타입 검증 없이 스키마 객체로 변환합니다."""
+    return GuideSchema(
+        title=data['title'],
+        description=data.get('description', ''),
+        questions=[
+            QuestionSchema(
+                text=q_data['text'],
+                question_id=q_data.get('question_id'),
+                category=q_data.get('category'),
+                context=q_data.get('context')
+            )
+            for q_data in data['questions']
+        ]
+    )
+
+
+@lru_cache(maxsize=64)
+def _load_guide_cached(path: str, mtime_ns: int, size: int) -> GuideSchema:
+    """
+    인터뷰 가이드 JSON을 파싱합니다.
+    
+    (경로, 수정 시각, 크기)를 키로 캐시하므로 파일이 바뀌면 자동으로 다시 파싱합니다.
+    반환된 스키마 객체는 캐시와 공유되므로 직접 수정하지 마세요.
+    """
+    with open(path, 'rb') as f:
+        return _decode_guide(f.read())
+
+
+def load_interviews_jsonl(path: str) -> Iterator[Dict[str, Any]]:
+    """
+    conduct_interviews(stream_path=...)로 저장한 JSONL 파일에서 인터뷰를 하나씩 읽습니다.
+    
+    전체 목록을 메모리에 올리지 않도록 제너레이터로 반환합니다.
+    """
+    with open(path, 'rb') as f:
+        for line in f:
+            if line.strip():
+                yield _loads(line)
+
+
+@dataclass(slots=True, frozen=True)
+class InterviewQuestion:
+    """인터뷰 질문 클래스 (불변, 해시 가능)"""
+    question_id: str
+    text: str
+    category: Optional[str] = None
+    context: Optional[str] = None
     
     def to_dict(self) -> Dict[str, Any]:
-        return {
-            "question_id": self.question_id,
-            "text": self.text,
-            "category": self.category,
-            "context": self.context
-        }
+        return asdict(self)
 
 
+@dataclass(slots=True)
 class InterviewGuide:
     """인터뷰 가이드 클래스"""
-    
-    def __init__(self, title: str, description: str = ""):
-        self.title = title
-        self.description = description
-        self.questions: List[InterviewQuestion] = []
-        self.created_at = datetime.now().isoformat()
+    title: str
+    description: str = ""
+    questions: List[InterviewQuestion] = field(default_factory=list)
+    created_at: str = field(default_factory=lambda: datetime.now().isoformat())
     
     def add_question(
         self,
@@ -132,17 +229,17 @@ class InterviewSystem:
     
     def load_guide_from_file(self, filepath: str) -> InterviewGuide:
         """파일에서 인터뷰 가이드를 로드합니다."""
-        with open(filepath, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        st = os.stat(filepath)
+        schema = _load_guide_cached(filepath, st.st_mtime_ns, st.st_size)
         
-        guide = InterviewGuide(data['title'], data.get('description', ''))
+        guide = InterviewGuide(schema.title, schema.description)
         
-        for q_data in data['questions']:
+        for q in schema.questions:
             guide.add_question(
-                text=q_data['text'],
-                question_id=q_data.get('question_id'),
-                category=q_data.get('category'),
-                context=q_data.get('context')
+                text=q.text,
+                question_id=q.question_id,
+                category=q.category,
+                context=q.context
             )
         
         self.interview_guide = guide
@@ -157,8 +254,8 @@ class InterviewSystem:
             self.console.print("[red]✗ 저장할 인터뷰 가이드가 없습니다.[/red]")
             return
         
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(self.interview_guide.to_dict(), f, ensure_ascii=False, indent=2)
+        with open(filepath, 'wb') as f:
+            f.write(_dumps(self.interview_guide.to_dict()))
         
         self.console.print(f"[green]✓ 인터뷰 가이드 저장됨: {filepath}[/green]")
     
@@ -182,19 +279,32 @@ class InterviewSystem:
         personas: List[Persona],
         guide: Optional[InterviewGuide] = None,
         delay: float = 0.5,
-        show_responses: bool = False
+        show_responses: bool = False,
+        max_inflight: int = 10,
+        window: int = 1000,
+        stream_path: Optional[str] = None
     ) -> List[Dict[str, Any]]:
         """
         인터뷰를 진행합니다.
         
+        모든 (페르소나, 질문) 요청을 비동기로 동시에 보내며,
+        동시에 진행 중인 요청 수는 max_inflight로 제한합니다.
+        대규모 실행에서도 태스크가 한꺼번에 생성되지 않도록
+        최대 window개의 태스크만 유지하며 완료되는 대로 다음 요청을 제출합니다.
+        
         Args:
             personas: 인터뷰할 페르소나 리스트
             guide: 인터뷰 가이드 (None인 경우 self.interview_guide 사용)
-            delay: 각 API 호출 사이의 지연 시간 (초)
+            delay: 각 동시 요청 슬롯에서 API 호출 사이의 지연 시간 (초)
             show_responses: 실시간으로 응답을 표시할지 여부
+                (stream_path를 지정한 경우 첫 번째로 저장된 인터뷰를 샘플로 표시)
+            max_inflight: 동시에 진행할 최대 API 요청 수
+            window: 동시에 유지할 최대 비동기 태스크 수
+            stream_path: 지정하면 페르소나별 인터뷰가 끝나는 즉시 이 경로에
+                JSONL로 추가 저장하고, 결과를 메모리에 보관하지 않습니다
         
         Returns:
-            인터뷰 결과 리스트
+            인터뷰 결과 리스트 (stream_path를 지정한 경우 빈 리스트)
         """
         if guide is None:
             guide = self.interview_guide
@@ -207,56 +317,69 @@ class InterviewSystem:
         self.console.print(f"[green]인터뷰 대상: {len(personas)}명[/green]")
         self.console.print(f"[green]질문: {len(guide.questions)}개[/green]\n")
         
-        interviews = []
-        
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            BarColumn(),
-            TaskProgressColumn(),
-            console=self.console
-        ) as progress:
-            
-            total_tasks = len(personas) * len(guide.questions)
-            task = progress.add_task("[cyan]인터뷰 진행 중...", total=total_tasks)
-            
-            for persona_idx, persona in enumerate(personas, 1):
-                interview_data = {
-                    "persona_id": persona.id,
-                    "interview_title": guide.title,
-                    "timestamp": datetime.now().isoformat(),
-                    "responses": []
-                }
+        def build_interview(persona_idx: int, responses: List[Dict[str, Any]]) -> Dict[str, Any]:
+            # 인터뷰 시각은 해당 페르소나의 첫 요청 시각 (응답들과 동일한 값)
+            if responses:
+                timestamp = responses[0]["timestamp"]
+            else:
+                timestamp = datetime.now().isoformat()
+            return {
+                "persona_id": personas[persona_idx].id,
+                "interview_title": guide.title,
+                "timestamp": timestamp,
+                "responses": responses
+            }
+        
+        stream_file = open(stream_path, 'ab') if stream_path else None
+        streamed = 0
+        sample: Optional[Dict[str, Any]] = None
+        
+        def write_interview(persona_idx: int, responses: List[Dict[str, Any]]) -> None:
+            nonlocal streamed, sample
+            interview = build_interview(persona_idx, responses)
+            stream_file.write(_dumps_line(interview))
+            stream_file.flush()
+            streamed += 1
+            # 응답 표시용 샘플은 첫 번째 인터뷰 하나만 보관
+            if show_responses and sample is None:
+                sample = interview
+        
+        try:
+            with Progress(
+                SpinnerColumn(),
+                TextColumn("[progress.description]{task.description}"),
+                BarColumn(),
+                TaskProgressColumn(),
+                console=self.console,
+                refresh_per_second=10
+            ) as progress:
                 
-                for question in guide.questions:
-                    progress.update(
-                        task,
-                        description=f"[cyan]인터뷰 {persona_idx}/{len(personas)} | {question.question_id}"
-                    )
-                    
-                    # AI 에이전트로 응답 생성
-                    response = self.ai_agent.respond_to_interview_question(
-                        persona,
-                        question.text,
-                        question.context
-                    )
-                    
-                    # 응답에 추가 정보 포함
-                    response.update({
-                        "question_id": question.question_id,
-                        "category": question.category,
-                        "timestamp": datetime.now().isoformat()
-                    })
-                    
-                    interview_data["responses"].append(response)
-                    
-                    progress.advance(task)
-                    
-                    # API 레이트 리밋 방지를 위한 지연
-                    if delay > 0:
-                        time.sleep(delay)
+                total_tasks = len(personas) * len(guide.questions)
+                task = progress.add_task("[cyan]인터뷰 진행 중...", total=total_tasks)
                 
-                interviews.append(interview_data)
+                responses = asyncio.run(self._collect_responses_async(
+                    personas, guide, delay, max_inflight, window, progress, task,
+                    on_persona_done=write_interview if stream_file else None
+                ))
+        finally:
+            if stream_file:
+                stream_file.close()
+        
+        if stream_path:
+            self.interviews = []
+            self.console.print("\n[bold green]✓ 인터뷰 완료![/bold green]")
+            self.console.print(f"[green]총 {streamed}개의 인터뷰 저장됨: {stream_path}[/green]\n")
+            
+            if sample is not None:
+                self._show_interview_responses([sample])
+            return []
+        
+        # 페르소나 × 질문 순서의 응답을 페르소나별 인터뷰로 재구성
+        n_questions = len(guide.questions)
+        interviews = [
+            build_interview(i, responses[i * n_questions:(i + 1) * n_questions])
+            for i in range(len(personas))
+        ]
         
         self.interviews = interviews
         
@@ -269,6 +392,110 @@ class InterviewSystem:
         
         return interviews
     
+    async def _collect_responses_async(
+        self,
+        personas: List[Persona],
+        guide: InterviewGuide,
+        delay: float,
+        max_inflight: int,
+        window: int,
+        progress: Progress,
+        task,
+        on_persona_done: Optional[Callable[[int, List[Dict[str, Any]]], None]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        모든 (페르소나, 질문) 응답을 동시에 생성하여 페르소나 × 질문 순서로 반환합니다.
+        
+        요청은 페르소나 순서대로 제출되므로 같은 페르소나의 질문들이 연달아 전송되어
+        페르소나 프롬프트 캐시(prompt_cache_key)를 재사용하고, 먼저 시작한 페르소나부터 끝납니다.
+        on_persona_done이 주어지면 한 페르소나의 모든 응답이 모이는 즉시
+        (페르소나 인덱스, 응답 리스트)로 호출하고, 해당 응답은 결과에서 비웁니다.
+        """
+        semaphore = asyncio.Semaphore(max_inflight)
+        
+        # 페르소나 프롬프트는 질문과 무관하므로 페르소나당 한 번만 생성
+        persona_prompts = [self.ai_agent.build_persona_prompt(persona) for persona in personas]
+        
+        # 응답 시각은 페르소나별 첫 요청 제출 시점 하나로 통일
+        timestamps: List[Optional[str]] = [None] * len(personas)
+        
+        # 비동기 클라이언트는 이번 이벤트 루프에서 만들고 끝나면 닫음
+        # (연결 풀이 루프에 묶이므로 conduct_interviews를 여러 번 호출해도 안전)
+        async with self.ai_agent.async_client() as aclient:
+            
+            async def ask(persona_idx: int, question: InterviewQuestion) -> Dict[str, Any]:
+                async with semaphore:
+                    # AI 에이전트로 응답 생성
+                    response = await self.ai_agent._respond_async(
+                        aclient,
+                        personas[persona_idx],
+                        question.text,
+                        question.context,
+                        persona_prompt=persona_prompts[persona_idx]
+                    )
+                    
+                    # API 레이트 리밋 방지를 위한 지연 (슬롯 단위)
+                    if delay > 0:
+                        await asyncio.sleep(delay)
+                
+                # 응답에 추가 정보 포함
+                response["question_id"] = question.question_id
+                response["category"] = question.category
+                response["timestamp"] = timestamps[persona_idx]
+                
+                return response
+            
+            n_questions = len(guide.questions)
+            
+            # 페르소나 단위로 요청을 제출 (같은 페르소나의 질문끼리 연속 처리)
+            calls = (
+                (persona_idx * n_questions + question_idx, (persona_idx, question))
+                for persona_idx in range(len(personas))
+                for question_idx, question in enumerate(guide.questions)
+            )
+            results: List[Optional[Dict[str, Any]]] = [None] * (len(personas) * len(guide.questions))
+            pending: Dict[asyncio.Task, int] = {}
+            remaining = [n_questions] * len(personas)
+            
+            def submit_next() -> None:
+                for index, args in calls:
+                    persona_idx = args[0]
+                    if timestamps[persona_idx] is None:
+                        timestamps[persona_idx] = datetime.now().isoformat()
+                    pending[asyncio.create_task(ask(*args))] = index
+                    return
+            
+            # 슬라이딩 윈도우: 최대 window개의 태스크를 유지하며 완료되는 대로 보충
+            for _ in range(max(1, window)):
+                submit_next()
+            
+            last_desc = None
+            
+            while pending:
+                done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for finished in done:
+                    response = finished.result()
+                    index = pending.pop(finished)
+                    results[index] = response
+                    submit_next()
+                    
+                    persona_idx = index // n_questions
+                    remaining[persona_idx] -= 1
+                    if on_persona_done and remaining[persona_idx] == 0:
+                        start = persona_idx * n_questions
+                        on_persona_done(persona_idx, results[start:start + n_questions])
+                        results[start:start + n_questions] = [None] * n_questions
+                
+                # 완료된 묶음 단위로 진행률을 한 번만 갱신하고, 설명은 응답자가 바뀔 때만 갱신
+                desc = f"[cyan]응답자 {persona_idx + 1}/{len(personas)} 인터뷰 중"
+                if desc != last_desc:
+                    progress.update(task, description=desc, advance=len(done))
+                    last_desc = desc
+                else:
+                    progress.advance(task, advance=len(done))
+            
+            return results
+    
     def conduct_single_interview(
         self,
         persona: Persona,
@@ -301,10 +528,12 @@ class InterviewSystem:
         ))
         self.console.print()
         
+        now_iso = datetime.now().isoformat()
+        
         interview_data = {
             "persona_id": persona.id,
             "interview_title": guide.title,
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": now_iso,
             "responses": []
         }
         
@@ -331,11 +560,9 @@ class InterviewSystem:
             elif response.get('error'):
                 self.console.print(f"[red]✗ 오류: {response['error']}[/red]")
             
-            response.update({
-                "question_id": question.question_id,
-                "category": question.category,
-                "timestamp": datetime.now().isoformat()
-            })
+            response["question_id"] = question.question_id
+            response["category"] = question.category
+            response["timestamp"] = now_iso
             
             interview_data["responses"].append(response)
             conversation_history.append({
@@ -365,11 +592,9 @@ class InterviewSystem:
                         ))
                     
                     # 후속 질문도 기록
-                    follow_up_response.update({
-                        "question_id": f"{question.question_id}_followup",
-                        "category": "follow_up",
-                        "timestamp": datetime.now().isoformat()
-                    })
+                    follow_up_response["question_id"] = f"{question.question_id}_followup"
+                    follow_up_response["category"] = "follow_up"
+                    follow_up_response["timestamp"] = now_iso
                     
                     interview_data["responses"].append(follow_up_response)
                     conversation_history.append({
@@ -411,8 +636,8 @@ class InterviewSystem:
             self.console.print("[yellow]⚠ 내보낼 인터뷰가 없습니다.[/yellow]")
             return
         
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(self.interviews, f, ensure_ascii=False, indent=2)
+        with open(filepath, 'wb') as f:
+            f.write(_dumps(self.interviews))
         
         self.console.print(f"[green]✓ 인터뷰 저장됨: {filepath}[/green]")
     
@@ -422,24 +647,29 @@ class InterviewSystem:
             self.console.print("[yellow]⚠ 내보낼 인터뷰가 없습니다.[/yellow]")
             return
         
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write(f"인터뷰 인터뷰록\n")
-            f.write(f"{'='*80}\n\n")
+        # 문자열 조각을 모아 한 번에 기록 (작은 write 호출 반복 방지)
+        major_rule = f"{'='*80}\n\n"
+        minor_rule = f"{'-'*40}\n\n"
+        chunks: List[str] = [f"인터뷰 인터뷰록\n{major_rule}"]
+        
+        for interview in self.interviews:
+            chunks.append(
+                f"응답자 ID: {interview['persona_id']}\n"
+                f"인터뷰: {interview['interview_title']}\n"
+                f"일시: {interview['timestamp']}\n"
+                f"{'-'*80}\n\n"
+            )
             
-            for interview in self.interviews:
-                f.write(f"응답자 ID: {interview['persona_id']}\n")
-                f.write(f"인터뷰: {interview['interview_title']}\n")
-                f.write(f"일시: {interview['timestamp']}\n")
-                f.write(f"{'-'*80}\n\n")
-                
-                for resp in interview['responses']:
-                    f.write(f"Q: {resp['question']}\n\n")
-                    f.write(f"A: {resp.get('response', '[응답 없음]')}\n\n")
-                    if resp.get('category'):
-                        f.write(f"   (카테고리: {resp['category']})\n\n")
-                    f.write(f"{'-'*40}\n\n")
-                
-                f.write(f"\n{'='*80}\n\n")
+            for resp in interview['responses']:
+                chunks.append(f"Q: {resp['question']}\n\nA: {resp.get('response', '[응답 없음]')}\n\n")
+                if resp.get('category'):
+                    chunks.append(f"   (카테고리: {resp['category']})\n\n")
+                chunks.append(minor_rule)
+            
+            chunks.append(f"\n{major_rule}")
+        
+        with open(filepath, 'w', encoding='utf-8', buffering=1 << 20) as f:
+            f.write("".join(chunks))
         
         self.console.print(f"[green]✓ 인터뷰 인터뷰록 저장됨: {filepath}[/green]")
 
@@ -3,8 +3,10 @@
 연구자가 설문조사나 인터뷰를 진행할 페르소나를 선택할 수 있도록 합니다.
 """
 
+import sys
+import numpy as np
 from typing import List, Dict, Any, Optional
-from rich.console import Console
+from rich.console import Console, Group
 from rich.table import Table
 from rich.prompt import Prompt, Confirm
 from rich.panel import Panel
@@ -125,7 +127,7 @@ class PersonaSelector:
                 continue
             
             # 해당 필드의 고유 값 표시
-            unique_values = self.loader.get_field_unique_values(field_name)
+            unique_values = self._get_field_unique_values(field_name)
             
             if unique_values and len(unique_values) < 50:
                 self.console.print(f"\n[cyan]'{field_name}'의 가능한 값:[/cyan]")
@@ -145,7 +147,7 @@ class PersonaSelector:
         
         # 필터 적용
         self.console.print(f"\n[cyan]필터 적용 중...[/cyan]")
-        personas = self.loader.search_personas(filters)
+        personas = self._search_personas(filters)
         
         self.console.print(f"[green]✓ {len(personas)}명의 응답자가 필터링되었습니다.[/green]\n")
         
@@ -163,6 +165,36 @@ class PersonaSelector:
         self.selected_personas = personas
         return personas
     
+    def _search_personas(self, filters: Dict[str, Any]) -> List[Persona]:
+        """
+        필터 조건에 맞는 페르소나를 불리언 마스크로 검색합니다.
+        
+        새 Persona 객체를 만들지 않고 로더의 기존 객체를 그대로 반환합니다.
+        (로더가 고유값이 적은 컬럼을 category로 불러오므로 비교는 정수 코드 비교로 처리됨)
+        """
+        df = self.loader.df
+        masks = [
+            df[field].isin(value).to_numpy() if isinstance(value, list)
+            else (df[field] == value).to_numpy()
+            for field, value in filters.items()
+            if field in df.columns
+        ]
+        
+        personas = self.loader.get_all_personas()
+        if not masks:
+            return list(personas)
+        
+        mask = np.logical_and.reduce(masks)
+        return [personas[i] for i in np.flatnonzero(mask)]
+    
+    def _get_field_unique_values(self, field: str) -> List[Any]:
+        """특정 필드의 고유값 목록을 반환합니다."""
+        df = self.loader.df
+        if field not in df.columns:
+            return []
+        
+        return sorted(df[field].dropna().unique().tolist())
+    
     def _select_by_ids(self) -> List[Persona]:
         """ID로 직접 페르소나를 선택합니다."""
         self.console.print("\n[bold]ID로 직접 선택[/bold]")
@@ -206,24 +238,38 @@ class PersonaSelector:
     
     def _show_preview(self, personas: List[Persona]) -> None:
         """선택된 페르소나의 미리보기를 표시합니다."""
+        summaries = [(persona.id, persona.get_summary()) for persona in personas]
+        remaining = len(self.selected_personas) - len(personas)
+        
+        # 터미널이 아니면 (CI, 파이프 등) Rich 렌더링 없이 일반 텍스트로 한 번에 출력
+        if not self.console.is_terminal:
+            lines = ["", "═══ 응답자 미리보기 ═══", ""]
+            for persona_id, summary in summaries:
+                lines.extend((f"[응답자 #{persona_id}]", summary, ""))
+            if remaining > 0:
+                lines.append(f"... 외 {remaining}명의 응답자")
+            sys.stdout.write("\n".join(lines) + "\n")
+            return
+        
         self.console.print("\n[bold cyan]═══ 응답자 미리보기 ═══[/bold cyan]\n")
         
-        for i, persona in enumerate(personas, 1):
-            panel_content = persona.get_summary()
-            
-            self.console.print(
+        # 패널을 하나의 Group으로 묶어 한 번의 레이아웃/출력으로 처리
+        renderables = []
+        for persona_id, summary in summaries:
+            renderables.append(
                 Panel(
-                    panel_content,
-                    title=f"[bold]응답자 #{persona.id}[/bold]",
+                    summary,
+                    title=f"[bold]응답자 #{persona_id}[/bold]",
                     border_style="cyan",
                     box=box.ROUNDED
                 )
             )
-            self.console.print()
+            renderables.append("")
+        
+        if remaining > 0:
+            renderables.append(f"[dim]... 외 {remaining}명의 응답자[/dim]\n")
         
-        if len(personas) < len(self.selected_personas):
-            remaining = len(self.selected_personas) - len(personas)
-            self.console.print(f"[dim]... 외 {remaining}명의 응답자[/dim]\n")
+        self.console.print(Group(*renderables))
     
     def get_selected_personas(self) -> List[Persona]:
         """선택된 페르소나를 반환합니다."""
@@ -6,18 +6,67 @@
 import json
 import csv
 import os
-from typing import List, Dict, Any, Optional
+import re
+import importlib.util
+from collections import Counter
+from functools import partial
+from typing import List, Dict, Any, Optional, Iterable, Iterator, Callable, Set, Tuple
 from datetime import datetime
 from pathlib import Path
-import pandas as pd
 from rich.console import Console
-from rich.table import Table
-from rich import box
+
+
+def _json_default(obj: Any) -> Any:
+    """기본 직렬화가 안 되는 값 처리 (datetime은 ISO 문자열, 그 외는 str)"""
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    return str(obj)
+
+
+# orjson이 설치되어 있으면 더 빠른 직렬화를 사용하고, 없으면 표준 json으로 대체
+try:
+    import orjson
+    
+    def _dumps(obj: Any) -> bytes:
+        return orjson.dumps(
+            obj,
+            default=_json_default,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+        )
+    
+    _loads = orjson.loads
+except ImportError:
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj, ensure_ascii=False, indent=2, default=_json_default).encode('utf-8')
+    
+    _loads = json.loads
+
+
+# pyarrow가 설치되어 있으면 Parquet/Feather 저장을 지원 (실제 import는 저장 시점에 수행)
+_HAS_PYARROW = importlib.util.find_spec("pyarrow") is not None
+# xlsxwriter가 설치되어 있으면 Excel을 constant_memory 모드로 스트리밍 저장
+_HAS_XLSXWRITER = importlib.util.find_spec("xlsxwriter") is not None
+
+
+# 파일명에 쓸 수 없는 문자 (유니코드 문자·숫자·밑줄·공백 이외)
+_SAFE_TITLE_RE = re.compile(r'[^\w ]', re.UNICODE)
+
+
+def _make_safe_filename(title: str) -> str:
+    """제목에서 파일명에 쓸 수 없는 문자를 제거하고 공백을 밑줄로 바꿉니다."""
+    return _SAFE_TITLE_RE.sub('', title).strip().replace(' ', '_')
 
 
 class ResultsManager:
     """결과 관리 시스템"""
     
+    # 표 형식(CSV, Parquet, Feather) 저장 시 열 구성
+    _SURVEY_FIELDS = ('persona_id', 'question_id', 'question', 'score', 'reasoning', 'category', 'timestamp')
+    _INTERVIEW_FIELDS = ('persona_id', 'interview_title', 'question_id', 'question', 'response', 'category', 'timestamp')
+    # Excel 시트 열 구성
+    _SURVEY_EXCEL_FIELDS = ('persona_id', 'question_id', 'question', 'score', 'reasoning', 'category')
+    _INTERVIEW_EXCEL_FIELDS = ('persona_id', 'question_id', 'question', 'response', 'category')
+    
     def __init__(self, output_dir: str = "results"):
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(exist_ok=True)
@@ -26,7 +75,8 @@ class ResultsManager:
     def save_survey_results(
         self,
         responses: List[Dict[str, Any]],
-        filename: Optional[str] = None
+        filename: Optional[str] = None,
+        formats: Optional[Iterable[str]] = None
     ) -> Dict[str, str]:
         """
         설문조사 결과를 여러 형식으로 저장합니다.
@@ -34,6 +84,8 @@ class ResultsManager:
         Args:
             responses: 설문조사 응답 리스트
             filename: 파일명 (없으면 자동 생성)
+            formats: 저장 형식 ('json', 'csv', 'summary', 'parquet', 'feather')
+                None이면 json, csv, summary와 (pyarrow가 있으면) parquet
         
         Returns:
             저장된 파일 경로들
@@ -46,27 +98,33 @@ class ResultsManager:
         if filename is None:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             survey_title = responses[0].get('survey_title', 'survey')
-            safe_title = "".join(c for c in survey_title if c.isalnum() or c in (' ', '_')).strip()
-            safe_title = safe_title.replace(' ', '_')
-            filename = f"{safe_title}_{timestamp}"
+            filename = f"{_make_safe_filename(survey_title)}_{timestamp}"
         
+        formats = self._resolve_formats(formats, 'summary')
         saved_files = {}
         
         # JSON 형식 저장
-        json_path = self.output_dir / f"{filename}.json"
-        with open(json_path, 'w', encoding='utf-8') as f:
-            json.dump(responses, f, ensure_ascii=False, indent=2)
-        saved_files['json'] = str(json_path)
+        if 'json' in formats:
+            json_path = self.output_dir / f"{filename}.json"
+            with open(json_path, 'wb') as f:
+                f.write(_dumps(responses))
+            saved_files['json'] = str(json_path)
         
         # CSV 형식 저장
-        csv_path = self.output_dir / f"{filename}.csv"
-        self._save_survey_to_csv(responses, csv_path)
-        saved_files['csv'] = str(csv_path)
+        if 'csv' in formats:
+            csv_path = self.output_dir / f"{filename}.csv"
+            self._save_survey_to_csv(responses, csv_path)
+            saved_files['csv'] = str(csv_path)
+        
+        # Parquet / Feather 형식 저장
+        if formats & {'parquet', 'feather'}:
+            saved_files.update(self._save_columnar(partial(self._survey_table, responses), filename, formats))
         
         # 분석 요약 저장
-        summary_path = self.output_dir / f"{filename}_summary.txt"
-        self._save_survey_summary(responses, summary_path)
-        saved_files['summary'] = str(summary_path)
+        if 'summary' in formats:
+            summary_path = self.output_dir / f"{filename}_summary.txt"
+            self._save_survey_summary(responses, summary_path)
+            saved_files['summary'] = str(summary_path)
         
         self.console.print(f"\n[bold green]✓ 설문조사 결과 저장 완료[/bold green]")
         for format_name, path in saved_files.items():
@@ -78,7 +136,8 @@ class ResultsManager:
     def save_interview_results(
         self,
         interviews: List[Dict[str, Any]],
-        filename: Optional[str] = None
+        filename: Optional[str] = None,
+        formats: Optional[Iterable[str]] = None
     ) -> Dict[str, str]:
         """
         인터뷰 결과를 여러 형식으로 저장합니다.
@@ -86,6 +145,8 @@ class ResultsManager:
         Args:
             interviews: 인터뷰 리스트
             filename: 파일명 (없으면 자동 생성)
+            formats: 저장 형식 ('json', 'transcript', 'csv', 'parquet', 'feather')
+                None이면 json, transcript, csv와 (pyarrow가 있으면) parquet
         
         Returns:
             저장된 파일 경로들
@@ -98,27 +159,33 @@ class ResultsManager:
         if filename is None:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             interview_title = interviews[0].get('interview_title', 'interview')
-            safe_title = "".join(c for c in interview_title if c.isalnum() or c in (' ', '_')).strip()
-            safe_title = safe_title.replace(' ', '_')
-            filename = f"{safe_title}_{timestamp}"
+            filename = f"{_make_safe_filename(interview_title)}_{timestamp}"
         
+        formats = self._resolve_formats(formats, 'transcript')
         saved_files = {}
         
         # JSON 형식 저장
-        json_path = self.output_dir / f"{filename}.json"
-        with open(json_path, 'w', encoding='utf-8') as f:
-            json.dump(interviews, f, ensure_ascii=False, indent=2)
-        saved_files['json'] = str(json_path)
+        if 'json' in formats:
+            json_path = self.output_dir / f"{filename}.json"
+            with open(json_path, 'wb') as f:
+                f.write(_dumps(interviews))
+            saved_files['json'] = str(json_path)
         
         # 인터뷰록 형식 저장
-        transcript_path = self.output_dir / f"{filename}_transcript.txt"
-        self._save_interview_transcript(interviews, transcript_path)
-        saved_files['transcript'] = str(transcript_path)
+        if 'transcript' in formats:
+            transcript_path = self.output_dir / f"{filename}_transcript.txt"
+            self._save_interview_transcript(interviews, transcript_path)
+            saved_files['transcript'] = str(transcript_path)
         
         # CSV 형식 저장
-        csv_path = self.output_dir / f"{filename}.csv"
-        self._save_interview_to_csv(interviews, csv_path)
-        saved_files['csv'] = str(csv_path)
+        if 'csv' in formats:
+            csv_path = self.output_dir / f"{filename}.csv"
+            self._save_interview_to_csv(interviews, csv_path)
+            saved_files['csv'] = str(csv_path)
+        
+        # Parquet / Feather 형식 저장
+        if formats & {'parquet', 'feather'}:
+            saved_files.update(self._save_columnar(partial(self._interview_table, interviews), filename, formats))
         
         self.console.print(f"\n[bold green]✓ 인터뷰 결과 저장 완료[/bold green]")
         for format_name, path in saved_files.items():
@@ -127,136 +194,205 @@ class ResultsManager:
         
         return saved_files
     
+    def _resolve_formats(self, formats: Optional[Iterable[str]], text_format: str) -> set:
+        """저장 형식 집합을 결정합니다 (None이면 기본 형식)."""
+        if formats is None:
+            formats = {'json', 'csv', text_format}
+            if _HAS_PYARROW:
+                formats.add('parquet')
+            return formats
+        return set(formats)
+    
+    def _save_columnar(
+        self,
+        get_table: Callable[[], Any],
+        filename: str,
+        formats: set
+    ) -> Dict[str, str]:
+        """
+        결과 테이블을 Parquet(zstd) / Feather(lz4) 파일로 저장합니다.
+        
+        DataFrame을 거치지 않고 pyarrow Table로 바로 기록합니다.
+        """
+        if not _HAS_PYARROW:
+            self.console.print("[yellow]⚠ pyarrow가 설치되어 있지 않아 Parquet/Feather 저장을 건너뜁니다.[/yellow]")
+            return {}
+        
+        import pyarrow as pa
+        
+        try:
+            table = get_table()
+        except (pa.ArrowInvalid, pa.ArrowTypeError) as e:
+            # 열 타입이 섞여 있으면 Arrow 테이블을 만들 수 없으므로 나머지 형식만 저장
+            self.console.print(f"[yellow]⚠ 열 타입이 섞여 있어 Parquet/Feather 저장을 건너뜁니다: {e}[/yellow]")
+            return {}
+        
+        saved_files = {}
+        
+        if 'parquet' in formats:
+            import pyarrow.parquet as pq
+            parquet_path = self.output_dir / f"{filename}.parquet"
+            pq.write_table(table, parquet_path, compression='zstd')
+            saved_files['parquet'] = str(parquet_path)
+        
+        if 'feather' in formats:
+            import pyarrow.feather as feather
+            feather_path = self.output_dir / f"{filename}.feather"
+            feather.write_feather(table, feather_path, compression='lz4')
+            saved_files['feather'] = str(feather_path)
+        
+        return saved_files
+    
+    def _survey_table(self, responses: List[Dict[str, Any]]):
+        """설문조사 응답의 Arrow 테이블 (_SURVEY_FIELDS 열)"""
+        import pyarrow as pa
+        
+        return pa.table({name: [resp.get(name) for resp in responses] for name in self._SURVEY_FIELDS})
+    
+    def _interview_table(self, interviews: List[Dict[str, Any]]):
+        """인터뷰 응답의 Arrow 테이블 (_INTERVIEW_FIELDS 열)"""
+        import pyarrow as pa
+        
+        columns = {name: [] for name in self._INTERVIEW_FIELDS}
+        column_values = list(columns.values())
+        for row in self._iter_interview_rows(interviews):
+            for values, value in zip(column_values, row):
+                values.append(value)
+        return pa.table(columns)
+    
     def _save_survey_to_csv(self, responses: List[Dict[str, Any]], filepath: Path) -> None:
         """설문조사 결과를 CSV로 저장합니다."""
-        # DataFrame 생성
-        rows = []
-        for resp in responses:
-            row = {
-                'persona_id': resp.get('persona_id'),
-                'question_id': resp.get('question_id'),
-                'question': resp.get('question'),
-                'score': resp.get('score'),
-                'reasoning': resp.get('reasoning'),
-                'category': resp.get('category'),
-                'timestamp': resp.get('timestamp')
-            }
-            rows.append(row)
-        
-        df = pd.DataFrame(rows)
-        df.to_csv(filepath, index=False, encoding='utf-8-sig')
+        fieldnames = self._SURVEY_FIELDS
+        self._write_rows_csv(filepath, fieldnames, (tuple(map(r.get, fieldnames)) for r in responses))
+    
+    def _write_rows_csv(self, filepath: Path, fieldnames: Iterable[str], rows: Iterable[tuple]) -> None:
+        """
+        헤더와 행 튜플을 CSV로 기록합니다 (UTF-8 BOM, 1 MiB 버퍼).
+        
+        rows는 제너레이터로 받아 전체 목록을 만들지 않고 기록합니다.
+        """
+        with open(filepath, 'w', encoding='utf-8-sig', newline='', buffering=1 << 20) as f:
+            writer = csv.writer(f)
+            writer.writerow(fieldnames)
+            writer.writerows(rows)
     
     def _save_survey_summary(self, responses: List[Dict[str, Any]], filepath: Path) -> None:
         """설문조사 결과 요약을 텍스트로 저장합니다."""
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write("설문조사 결과 요약\n")
-            f.write("="*80 + "\n\n")
-            
-            # 기본 정보
-            survey_title = responses[0].get('survey_title', 'Unknown')
-            total_responses = len(responses)
-            unique_personas = len(set(r.get('persona_id') for r in responses))
-            unique_questions = len(set(r.get('question_id') for r in responses))
-            
-            f.write(f"설문조사: {survey_title}\n")
-            f.write(f"총 응답: {total_responses}개\n")
-            f.write(f"응답자: {unique_personas}명\n")
-            f.write(f"질문: {unique_questions}개\n\n")
-            
+        # 기본 정보
+        survey_title = responses[0].get('survey_title', 'Unknown')
+        total_responses = len(responses)
+        question_stats, persona_ids = self._aggregate_scores(responses)
+        unique_personas = len(persona_ids)
+        unique_questions = len(question_stats)
+        
+        parts: List[str] = [
+            "설문조사 결과 요약\n",
+            "="*80 + "\n\n",
+            f"설문조사: {survey_title}\n",
+            f"총 응답: {total_responses}개\n",
+            f"응답자: {unique_personas}명\n",
+            f"질문: {unique_questions}개\n\n",
             # 질문별 통계
-            f.write("-"*80 + "\n")
-            f.write("질문별 통계\n")
-            f.write("-"*80 + "\n\n")
+            "-"*80 + "\n",
+            "질문별 통계\n",
+            "-"*80 + "\n\n"
+        ]
+        
+        for qid, stats in question_stats.items():
+            parts.append(f"[{qid}] {stats['question']}\n")
             
-            question_stats = {}
-            for resp in responses:
-                qid = resp.get('question_id', 'Unknown')
-                question = resp.get('question', '')
-                score = resp.get('score')
+            if stats['counter']:
+                summary = self._score_summary(stats['counter'])
                 
-                if qid not in question_stats:
-                    question_stats[qid] = {
-                        'question': question,
-                        'scores': [],
-                        'errors': 0
-                    }
-                
-                if score is not None:
-                    question_stats[qid]['scores'].append(score)
-                else:
-                    question_stats[qid]['errors'] += 1
+                parts.append(
+                    f"  평균: {summary['mean']:.2f}\n"
+                    f"  범위: {summary['min']} ~ {summary['max']}\n"
+                    f"  응답 수: {summary['count']}\n"
+                    f"  분포: {summary['distribution']}\n"
+                )
             
-            for qid, stats in question_stats.items():
-                f.write(f"[{qid}] {stats['question']}\n")
-                
-                if stats['scores']:
-                    mean = sum(stats['scores']) / len(stats['scores'])
-                    min_score = min(stats['scores'])
-                    max_score = max(stats['scores'])
-                    
-                    # 분포 계산
-                    distribution = {i: stats['scores'].count(i) for i in range(1, 8)}
-                    
-                    f.write(f"  평균: {mean:.2f}\n")
-                    f.write(f"  범위: {min_score} ~ {max_score}\n")
-                    f.write(f"  응답 수: {len(stats['scores'])}\n")
-                    f.write(f"  분포: {distribution}\n")
-                
-                if stats['errors'] > 0:
-                    f.write(f"  오류: {stats['errors']}개\n")
-                
-                f.write("\n")
+            if stats['errors'] > 0:
+                parts.append(f"  오류: {stats['errors']}개\n")
+            
+            parts.append("\n")
+        
+        # 모은 문자열을 한 번에 기록
+        with open(filepath, 'w', encoding='utf-8', buffering=1 << 20) as f:
+            f.write("".join(parts))
     
     def _save_interview_transcript(self, interviews: List[Dict[str, Any]], filepath: Path) -> None:
         """인터뷰를 인터뷰록 형식으로 저장합니다."""
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write("인터뷰 인터뷰록\n")
-            f.write("="*80 + "\n\n")
+        header_rule = "-"*80
+        minor_rule = "-"*40 + "\n\n"
+        
+        with open(filepath, 'w', encoding='utf-8', buffering=1 << 20) as f:
+            f.write("인터뷰 인터뷰록\n" + "="*80 + "\n\n")
             
             for idx, interview in enumerate(interviews, 1):
-                f.write(f"인터뷰 #{idx}\n")
-                f.write("-"*80 + "\n")
-                f.write(f"응답자 ID: {interview['persona_id']}\n")
-                f.write(f"인터뷰 제목: {interview['interview_title']}\n")
-                f.write(f"일시: {interview['timestamp']}\n")
-                f.write("-"*80 + "\n\n")
+                # 인터뷰 하나를 문자열 조각으로 모아 한 번에 기록
+                parts: List[str] = [
+                    f"인터뷰 #{idx}\n"
+                    f"{header_rule}\n"
+                    f"응답자 ID: {interview['persona_id']}\n"
+                    f"인터뷰 제목: {interview['interview_title']}\n"
+                    f"일시: {interview['timestamp']}\n"
+                    f"{header_rule}\n\n"
+                ]
                 
                 for resp in interview.get('responses', []):
-                    f.write(f"Q: {resp['question']}\n\n")
+                    parts.append(f"Q: {resp['question']}\n\n")
                     
                     if resp.get('response'):
-                        f.write(f"A: {resp['response']}\n\n")
+                        parts.append(f"A: {resp['response']}\n\n")
                     else:
-                        f.write("A: [응답 없음]\n\n")
+                        parts.append("A: [응답 없음]\n\n")
                     
                     if resp.get('category'):
-                        f.write(f"   (카테고리: {resp['category']})\n\n")
+                        parts.append(f"   (카테고리: {resp['category']})\n\n")
                     
-                    f.write("-"*40 + "\n\n")
+                    parts.append(minor_rule)
                 
-                f.write("\n" + "="*80 + "\n\n")
+                parts.append("\n" + "="*80 + "\n\n")
+                f.write("".join(parts))
     
     def _save_interview_to_csv(self, interviews: List[Dict[str, Any]], filepath: Path) -> None:
         """인터뷰 결과를 CSV로 저장합니다."""
-        rows = []
+        self._write_rows_csv(filepath, self._INTERVIEW_FIELDS, self._iter_interview_rows(interviews))
+    
+    @staticmethod
+    def _iter_interview_rows(interviews: List[Dict[str, Any]]) -> Iterator[tuple]:
+        """
+        인터뷰를 (인터뷰, 응답) 단위의 행으로 펼쳐 하나씩 반환합니다 (목록을 만들지 않음).
+        
+        각 행은 _INTERVIEW_FIELDS 순서의 튜플입니다.
+        """
         for interview in interviews:
             persona_id = interview['persona_id']
             interview_title = interview['interview_title']
             
             for resp in interview.get('responses', []):
-                row = {
-                    'persona_id': persona_id,
-                    'interview_title': interview_title,
-                    'question_id': resp.get('question_id'),
-                    'question': resp.get('question'),
-                    'response': resp.get('response'),
-                    'category': resp.get('category'),
-                    'timestamp': resp.get('timestamp')
-                }
-                rows.append(row)
+                yield (
+                    persona_id,
+                    interview_title,
+                    resp.get('question_id'),
+                    resp.get('question'),
+                    resp.get('response'),
+                    resp.get('category'),
+                    resp.get('timestamp')
+                )
+    
+    @staticmethod
+    def load_jsonl(path: str) -> Iterator[Dict[str, Any]]:
+        """
+        conduct_survey(stream_path=...) 등으로 저장한 JSONL 파일에서 레코드를 하나씩 읽습니다.
         
-        df = pd.DataFrame(rows)
-        df.to_csv(filepath, index=False, encoding='utf-8-sig')
+        전체 목록을 메모리에 올리지 않도록 제너레이터로 반환합니다.
+        필요하면 list(...)로 감싸 save_survey_results 등에 그대로 넘길 수 있습니다.
+        """
+        with open(path, 'rb') as f:
+            for line in f:
+                if line.strip():
+                    yield _loads(line)
     
     def analyze_survey_results(self, responses: List[Dict[str, Any]]) -> Dict[str, Any]:
         """
@@ -271,41 +407,79 @@ class ResultsManager:
         if not responses:
             return {}
         
+        # 원본 점수 리스트는 화면의 중앙값/표준편차 계산에 사용
+        question_stats, persona_ids = self._aggregate_scores(responses, keep_scores=True)
+        
         analysis = {
             'total_responses': len(responses),
-            'unique_personas': len(set(r.get('persona_id') for r in responses)),
-            'unique_questions': len(set(r.get('question_id') for r in responses)),
+            'unique_personas': len(persona_ids),
+            'unique_questions': len(question_stats),
             'questions': {}
         }
         
         # 질문별 분석
+        for qid, stats in question_stats.items():
+            counter = stats.pop('counter')
+            if counter:
+                stats.update(self._score_summary(counter))
+            analysis['questions'][qid] = stats
+        
+        return analysis
+    
+    def _aggregate_scores(
+        self,
+        responses: List[Dict[str, Any]],
+        keep_scores: bool = False
+    ) -> Tuple[Dict[str, Dict[str, Any]], Set[Any]]:
+        """
+        질문별 점수 분포와 오류 수, 응답자 ID를 한 번의 순회로 집계합니다.
+        
+        Args:
+            responses: 설문조사 응답 리스트
+            keep_scores: 원본 점수 리스트('scores')도 함께 보관할지 여부
+        
+        Returns:
+            ({질문 ID: {'question', 'counter', 'errors'[, 'scores']}}, 응답자 ID 집합)
+        """
+        question_stats = {}
+        persona_ids = set()
+        
         for resp in responses:
+            persona_ids.add(resp.get('persona_id'))
             qid = resp.get('question_id', 'Unknown')
+            stats = question_stats.get(qid)
             
-            if qid not in analysis['questions']:
-                analysis['questions'][qid] = {
+            if stats is None:
+                stats = question_stats[qid] = {
                     'question': resp.get('question', ''),
-                    'scores': [],
+                    'counter': Counter(),
                     'errors': 0
                 }
+                if keep_scores:
+                    stats['scores'] = []
             
             score = resp.get('score')
             if score is not None:
-                analysis['questions'][qid]['scores'].append(score)
+                stats['counter'][score] += 1
+                if keep_scores:
+                    stats['scores'].append(score)
             else:
-                analysis['questions'][qid]['errors'] += 1
+                stats['errors'] += 1
         
-        # 통계 계산
-        for qid, data in analysis['questions'].items():
-            if data['scores']:
-                scores = data['scores']
-                data['mean'] = sum(scores) / len(scores)
-                data['min'] = min(scores)
-                data['max'] = max(scores)
-                data['count'] = len(scores)
-                data['distribution'] = {i: scores.count(i) for i in range(1, 8)}
-        
-        return analysis
+        return question_stats, persona_ids
+    
+    @staticmethod
+    def _score_summary(counter: Counter) -> Dict[str, Any]:
+        """점수 분포(Counter)에서 평균, 범위, 응답 수, 1-7 분포를 계산합니다."""
+        count = sum(counter.values())
+        
+        return {
+            'mean': sum(score * n for score, n in counter.items()) / count,
+            'min': min(counter),
+            'max': max(counter),
+            'count': count,
+            'distribution': {i: counter.get(i, 0) for i in range(1, 8)}
+        }
     
     def show_survey_analysis(self, responses: List[Dict[str, Any]]) -> None:
         """설문조사 분석 결과를 콘솔에 표시합니다."""
@@ -315,6 +489,9 @@ class ResultsManager:
             self.console.print("[yellow]⚠ 분석할 결과가 없습니다.[/yellow]")
             return
         
+        from rich.table import Table
+        from rich import box
+        
         self.console.print("\n[bold cyan]═══ 설문조사 결과 분석 ═══[/bold cyan]\n")
         
         # 기본 정보
@@ -348,6 +525,20 @@ class ResultsManager:
         self.console.print(stats_table)
         self.console.print()
     
+    @staticmethod
+    def _arrow_frame(get_table: Callable[[], Any], fieldnames: Iterable[str]):
+        """
+        Arrow(C++)로 행을 변환해 DataFrame을 만듭니다.
+        
+        열 타입이 섞여 테이블을 만들 수 없으면 None을 반환하여 행 기반 변환으로 대체하게 합니다.
+        """
+        import pyarrow as pa
+        
+        try:
+            return get_table().select(list(fieldnames)).to_pandas()
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            return None
+    
     def export_to_excel(
         self,
         survey_responses: Optional[List[Dict[str, Any]]] = None,
@@ -371,42 +562,53 @@ class ResultsManager:
         
         filepath = self.output_dir / filename
         
-        with pd.ExcelWriter(filepath, engine='openpyxl') as writer:
-            # 설문조사 결과
-            if survey_responses:
-                rows = []
-                for resp in survey_responses:
-                    row = {
-                        'persona_id': resp.get('persona_id'),
-                        'question_id': resp.get('question_id'),
-                        'question': resp.get('question'),
-                        'score': resp.get('score'),
-                        'reasoning': resp.get('reasoning'),
-                        'category': resp.get('category')
-                    }
-                    rows.append(row)
-                
-                df = pd.DataFrame(rows)
-                df.to_excel(writer, sheet_name='Survey', index=False)
+        sheets = {}
+        
+        # 설문조사 결과
+        if survey_responses:
+            sheets['Survey'] = (
+                self._SURVEY_EXCEL_FIELDS,
+                (
+                    tuple(resp.get(name) for name in self._SURVEY_EXCEL_FIELDS)
+                    for resp in survey_responses
+                ),
+                partial(self._survey_table, survey_responses)
+            )
+        
+        # 인터뷰 결과
+        if interviews:
+            sheets['Interview'] = (
+                self._INTERVIEW_EXCEL_FIELDS,
+                (
+                    (interview['persona_id'],) + tuple(resp.get(name) for name in self._INTERVIEW_EXCEL_FIELDS[1:])
+                    for interview in interviews
+                    for resp in interview.get('responses', [])
+                ),
+                partial(self._interview_table, interviews)
+            )
+        
+        if _HAS_XLSXWRITER:
+            # 행을 순서대로 바로 디스크에 기록 (워크북 전체를 메모리에 두지 않음)
+            import xlsxwriter
             
-            # 인터뷰 결과
-            if interviews:
-                rows = []
-                for interview in interviews:
-                    persona_id = interview['persona_id']
-                    
-                    for resp in interview.get('responses', []):
-                        row = {
-                            'persona_id': persona_id,
-                            'question_id': resp.get('question_id'),
-                            'question': resp.get('question'),
-                            'response': resp.get('response'),
-                            'category': resp.get('category')
-                        }
-                        rows.append(row)
-                
-                df = pd.DataFrame(rows)
-                df.to_excel(writer, sheet_name='Interview', index=False)
+            workbook = xlsxwriter.Workbook(str(filepath), {'constant_memory': True})
+            try:
+                for sheet_name, (fieldnames, rows, _) in sheets.items():
+                    worksheet = workbook.add_worksheet(sheet_name)
+                    worksheet.write_row(0, 0, fieldnames)
+                    for row_idx, row in enumerate(rows, 1):
+                        worksheet.write_row(row_idx, 0, row)
+            finally:
+                workbook.close()
+        else:
+            import pandas as pd
+            
+            with pd.ExcelWriter(filepath, engine='openpyxl') as writer:
+                for sheet_name, (fieldnames, rows, get_table) in sheets.items():
+                    df = self._arrow_frame(get_table, fieldnames) if _HAS_PYARROW else None
+                    if df is None:
+                        df = pd.DataFrame(list(rows), columns=list(fieldnames))
+                    df.to_excel(writer, sheet_name=sheet_name, index=False)
         
         self.console.print(f"[green]✓ Excel 파일 저장됨: {filepath}[/green]")
         return str(filepath)
@@ -5,17 +5,52 @@
 
 import json
 import time
+import asyncio
+import threading
+from collections import Counter
 from typing import List, Dict, Any, Optional
 from datetime import datetime
 from rich.console import Console
-from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TaskProgressColumn
-from rich.table import Table
 from rich.prompt import Prompt, Confirm
-from rich import box
 from src.dataset_loader import Persona
 from src.ai_agent import AIAgent
 
 
+def _json_default(obj: Any) -> Any:
+    """기본 직렬화가 안 되는 값 처리 (datetime은 ISO 문자열, 그 외는 str)"""
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    return str(obj)
+
+
+# orjson이 설치되어 있으면 더 빠른 직렬화를 사용하고, 없으면 표준 json으로 대체
+try:
+    import orjson
+    
+    def _dumps(obj: Any) -> bytes:
+        return orjson.dumps(
+            obj,
+            default=_json_default,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+        )
+    
+    def _dumps_line(obj: Any) -> bytes:
+        return orjson.dumps(obj, default=_json_default, option=orjson.OPT_NON_STR_KEYS) + b"\n"
+except ImportError:
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj, ensure_ascii=False, indent=2, default=_json_default).encode('utf-8')
+    
+    def _dumps_line(obj: Any) -> bytes:
+        return json.dumps(obj, ensure_ascii=False, default=_json_default).encode('utf-8') + b"\n"
+
+
+# aiolimiter가 설치되어 있으면 비동기 설문의 초당 요청 수를 전역으로 제한
+try:
+    from aiolimiter import AsyncLimiter
+except ImportError:
+    AsyncLimiter = None
+
+
 class SurveyQuestion:
     """설문 질문 클래스"""
     
@@ -75,11 +110,17 @@ class Survey:
 class SurveySystem:
     """설문조사 시스템"""
     
+    # 진행률 표시줄 렌더링 비용을 줄이기 위해 이 개수만큼 모아서 갱신
+    _PROGRESS_BATCH = 10
+    
     def __init__(self, ai_agent: AIAgent):
         self.ai_agent = ai_agent
         self.console = Console()
         self.survey: Optional[Survey] = None
-        self.responses: List[Dict[str, Any]] = []
+        # 설문 요청 속도 제한용 토큰 버킷 상태 (다음 요청을 보낼 수 있는 monotonic 시각)
+        # 동기 설문용 토큰 버킷 상태 (다음 요청을 보낼 수 있는 monotonic 시각)
+        self._rate_lock = threading.Lock()
+        self._next_request_at = 0.0
     
     def create_survey_wizard(self) -> Survey:
         """대화형 설문조사 생성 마법사"""
@@ -162,8 +203,8 @@ class SurveySystem:
             self.console.print("[red]✗ 저장할 설문조사가 없습니다.[/red]")
             return
         
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(self.survey.to_dict(), f, ensure_ascii=False, indent=2)
+        with open(filepath, 'wb') as f:
+            f.write(_dumps(self.survey.to_dict()))
         
         self.console.print(f"[green]✓ 설문조사 템플릿 저장됨: {filepath}[/green]")
     
@@ -185,18 +226,65 @@ class SurveySystem:
         self,
         personas: List[Persona],
         survey: Optional[Survey] = None,
-        delay: float = 0.5
+        delay: float = 0.5,
+        stream_path: Optional[str] = None,
+        rate_limit: Optional[float] = None,
+        concurrency: int = 10
     ) -> List[Dict[str, Any]]:
         """
         설문조사를 진행합니다.
         
+        모든 (페르소나, 질문) 요청을 비동기로 동시에 보내며 (conduct_survey_async),
+        동시에 진행 중인 요청 수는 concurrency로 제한합니다.
+        
+        Args:
+            personas: 응답할 페르소나 리스트
+            survey: 설문조사 객체 (None인 경우 self.survey 사용)
+            delay: 각 동시 요청 슬롯에서 API 호출 사이의 지연 시간 (초)
+            stream_path: 지정하면 응답자별 응답이 모두 모이는 즉시 이 경로에 JSONL로 추가 저장하고,
+                결과를 메모리에 보관하지 않습니다 (응답자 단위로 flush)
+            rate_limit: 초당 최대 요청 수. 지정하면 delay 대신 필요한 만큼만 대기합니다
+            concurrency: 동시에 진행할 최대 API 요청 수 (1이면 순차 진행)
+        
+        Returns:
+            응답 결과 리스트 (stream_path를 지정한 경우 빈 리스트)
+        """
+        return asyncio.run(self.conduct_survey_async(
+            personas,
+            survey,
+            concurrency=concurrency,
+            max_rate=rate_limit,
+            delay=delay,
+            stream_path=stream_path
+        ))
+    
+    async def conduct_survey_async(
+        self,
+        personas: List[Persona],
+        survey: Optional[Survey] = None,
+        concurrency: int = 10,
+        max_rate: Optional[float] = None,
+        delay: float = 0.0,
+        stream_path: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        설문조사를 비동기로 동시에 진행합니다.
+        
+        모든 (페르소나, 질문) 요청을 최대 concurrency개씩 동시에 보내며,
+        응답 순서는 페르소나 × 질문 순입니다.
+        
         Args:
             personas: 응답할 페르소나 리스트
             survey: 설문조사 객체 (None인 경우 self.survey 사용)
-            delay: 각 API 호출 사이의 지연 시간 (초)
+            concurrency: 동시에 진행할 최대 API 요청 수
+            max_rate: 전체 요청에 적용할 초당 최대 요청 수
+                (aiolimiter가 있으면 AsyncLimiter, 없으면 내장 토큰 버킷 사용)
+            delay: 각 동시 요청 슬롯에서 API 호출 사이의 지연 시간 (초, max_rate를 지정하면 무시)
+            stream_path: 지정하면 응답자별 응답이 모두 모이는 즉시 이 경로에 JSONL로 추가 저장하고,
+                결과를 메모리에 보관하지 않습니다
         
         Returns:
-            응답 결과 리스트
+            응답 결과 리스트 (stream_path를 지정한 경우 빈 리스트)
         """
         if survey is None:
             survey = self.survey
@@ -210,52 +298,106 @@ class SurveySystem:
         self.console.print(f"[green]질문: {len(survey.questions)}개[/green]")
         self.console.print(f"[green]총 응답: {len(personas) * len(survey.questions)}개[/green]\n")
         
-        responses = []
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+        limiter = AsyncLimiter(max_rate, 1.0) if max_rate and AsyncLimiter is not None else None
         
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            BarColumn(),
-            TaskProgressColumn(),
-            console=self.console
-        ) as progress:
+        survey_title = survey.title
+        questions = survey.questions
+        n_questions = len(questions)
+        responses: List[Optional[Dict[str, Any]]] = [None] * (len(personas) * n_questions)
+        remaining = [n_questions] * len(personas)
+        
+        # 응답 시각은 응답자별 첫 응답 시점 하나로 통일
+        timestamps: List[Optional[str]] = [None] * len(personas)
+        
+        async def call(aclient: Any, persona: Persona, question: SurveyQuestion) -> Dict[str, Any]:
+            if limiter is not None:
+                async with limiter:
+                    return await self.ai_agent.respond_to_survey_question_async(
+                        aclient, persona, question.text, question.scale_description
+                    )
+            if max_rate:
+                await asyncio.sleep(self._reserve_token(max_rate))
+            return await self.ai_agent.respond_to_survey_question_async(
+                aclient, persona, question.text, question.scale_description
+            )
+        
+        async def answer(aclient: Any, persona_idx: int, q_idx: int) -> int:
+            question = questions[q_idx]
             
-            total_tasks = len(personas) * len(survey.questions)
-            task = progress.add_task("[cyan]설문 진행 중...", total=total_tasks)
+            async with semaphore:
+                response = await call(aclient, personas[persona_idx], question)
+                
+                # API 레이트 리밋 방지를 위한 지연 (슬롯 단위, max_rate를 지정한 경우 리미터가 대신 처리)
+                if delay > 0 and not max_rate:
+                    await asyncio.sleep(delay)
             
-            for persona_idx, persona in enumerate(personas, 1):
-                for question in survey.questions:
-                    progress.update(
-                        task,
-                        description=f"[cyan]응답자 {persona_idx}/{len(personas)} | {question.question_id}"
-                    )
-                    
-                    # AI 에이전트로 응답 생성
-                    response = self.ai_agent.respond_to_survey_question(
-                        persona,
-                        question.text,
-                        question.scale_description
-                    )
-                    
-                    # 응답에 추가 정보 포함
-                    response.update({
-                        "survey_title": survey.title,
-                        "question_id": question.question_id,
-                        "category": question.category,
-                        "timestamp": datetime.now().isoformat()
-                    })
+            ts = timestamps[persona_idx]
+            if ts is None:
+                ts = timestamps[persona_idx] = datetime.now().isoformat()
+            
+            # 응답에 추가 정보 포함
+            response.update({
+                "survey_title": survey_title,
+                "question_id": question.question_id,
+                "category": question.category,
+                "timestamp": ts
+            })
+            
+            responses[persona_idx * n_questions + q_idx] = response
+            return persona_idx
+        
+        stream_file = open(stream_path, 'ab') if stream_path else None
+        streamed = 0
+        
+        try:
+            # 비동기 클라이언트는 이번 이벤트 루프에서 만들고 끝나면 닫음 (연결 풀이 루프에 묶임)
+            async with self.ai_agent.async_client() as aclient:
+                with self._progress() as progress:
                     
-                    responses.append(response)
+                    task = progress.add_task("[cyan]설문 진행 중...", total=len(responses))
                     
-                    progress.advance(task)
+                    # 모든 처리가 한 이벤트 루프 스레드에서 이루어지므로 완료 순서대로 세되,
+                    # 진행률은 batch개 단위로 모아서 갱신
+                    batch = self._PROGRESS_BATCH
+                    pending = 0
+                    for finished in asyncio.as_completed([
+                        answer(aclient, persona_idx, q_idx)
+                        for persona_idx in range(len(personas))
+                        for q_idx in range(n_questions)
+                    ]):
+                        persona_idx = await finished
+                        
+                        # 응답자의 모든 응답이 모이면 질문 순서대로 기록하고 메모리에서 비움
+                        remaining[persona_idx] -= 1
+                        if stream_file and remaining[persona_idx] == 0:
+                            start = persona_idx * n_questions
+                            for response in responses[start:start + n_questions]:
+                                stream_file.write(_dumps_line(response))
+                            stream_file.flush()
+                            streamed += n_questions
+                            responses[start:start + n_questions] = [None] * n_questions
+                        
+                        pending += 1
+                        if pending >= batch:
+                            progress.advance(task, advance=pending)
+                            pending = 0
                     
-                    # API 레이트 리밋 방지를 위한 지연
-                    if delay > 0:
-                        time.sleep(delay)
+                    if pending:
+                        progress.advance(task, advance=pending)
+        finally:
+            if stream_file:
+                stream_file.close()
+        
+        if stream_path:
+            self.responses = []
+            self.console.print("\n[bold green]✓ 설문조사 완료![/bold green]")
+            self.console.print(f"[green]총 {streamed}개의 응답 저장됨: {stream_path}[/green]\n")
+            return []
         
         self.responses = responses
         
-        self.console.print(f"\n[bold green]✓ 설문조사 완료![/bold green]")
+        self.console.print("\n[bold green]✓ 설문조사 완료![/bold green]")
         self.console.print(f"[green]총 {len(responses)}개의 응답 수집됨[/green]\n")
         
         # 간단한 통계 표시
@@ -263,29 +405,61 @@ class SurveySystem:
         
         return responses
     
+    def _reserve_token(self, rate_limit: float) -> float:
+        """
+        전역 요청 속도가 rate_limit(초당 요청 수)를 넘지 않도록 다음 요청 시각을 예약하고,
+        그때까지 기다려야 할 시간(초)을 반환합니다.
+        
+        이전 요청이 이미 1/rate_limit초 이상 지났다면 0을 반환합니다.
+        """
+        interval = 1.0 / rate_limit
+        with self._rate_lock:
+            now = time.monotonic()
+            wait = self._next_request_at - now
+            self._next_request_at = max(now, self._next_request_at) + interval
+        
+        return max(0.0, wait)
+    
+    def _progress(self):
+        """설문 진행률 표시줄을 생성합니다 (rich.progress는 설문 진행 시에만 import)."""
+        from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TaskProgressColumn
+        
+        return Progress(
+            SpinnerColumn(),
+            TextColumn("[progress.description]{task.description}"),
+            BarColumn(),
+            TaskProgressColumn(),
+            console=self.console,
+            refresh_per_second=4
+        )
+    
     def _show_response_statistics(self, responses: List[Dict[str, Any]]) -> None:
         """응답 통계를 표시합니다."""
         if not responses:
             return
         
-        # 질문별 평균 점수 계산
+        from rich.table import Table
+        from rich import box
+        
+        # 질문별 점수 분포 집계 (점수 리스트를 만들지 않음)
         question_stats = {}
         
         for response in responses:
             qid = response.get('question_id', 'Unknown')
             score = response.get('score')
             
-            if qid not in question_stats:
-                question_stats[qid] = {
-                    'scores': [],
+            stats = question_stats.get(qid)
+            if stats is None:
+                stats = question_stats[qid] = {
+                    'counter': Counter(),
                     'question': response.get('question', ''),
                     'errors': 0
                 }
             
             if score is not None:
-                question_stats[qid]['scores'].append(score)
+                stats['counter'][score] += 1
             else:
-                question_stats[qid]['errors'] += 1
+                stats['errors'] += 1
         
         # 통계 테이블 생성
         table = Table(title="설문 응답 통계", box=box.ROUNDED)
@@ -295,13 +469,14 @@ class SurveySystem:
         table.add_column("오류", style="red", justify="right")
         
         for qid, stats in question_stats.items():
-            scores = stats['scores']
-            avg_score = sum(scores) / len(scores) if scores else 0
+            counter = stats['counter']
+            count = sum(counter.values())
+            avg_score = sum(score * n for score, n in counter.items()) / count if count else 0
             
             table.add_row(
                 qid,
                 f"{avg_score:.2f}",
-                str(len(scores)),
+                str(count),
                 str(stats['errors']) if stats['errors'] > 0 else "-"
             )
         
@@ -318,8 +493,8 @@ class SurveySystem:
             self.console.print("[yellow]⚠ 내보낼 응답이 없습니다.[/yellow]")
             return
         
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(self.responses, f, ensure_ascii=False, indent=2)
+        with open(filepath, 'wb') as f:
+            f.write(_dumps(self.responses))
         
         self.console.print(f"[green]✓ 응답 저장됨: {filepath}[/green]")
 
@@ -0,0 +1,11 @@
+"""
+테스트 공통 설정
+저장소 루트를 import 경로에 추가하여 `src` 패키지를 그대로 불러옵니다.
+"""
+
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
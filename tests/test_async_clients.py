@@ -0,0 +1,109 @@
+"""
+비동기 클라이언트 재사용 회귀 테스트
+같은 에이전트로 asyncio.run을 여러 번 실행해도 이전 이벤트 루프에 묶인 클라이언트를 쓰지 않는지 확인합니다.
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("openai")
+pytest.importorskip("rich")
+pytest.importorskip("pandas")
+
+from src.ai_agent import AIAgent
+from src.dataset_loader import Persona
+from src.interview_system import InterviewGuide, InterviewSystem
+from src.results_manager import ResultsManager
+from src.survey_system import Survey, SurveySystem
+
+
+class LoopBoundClient:
+    """만든 이벤트 루프 밖에서 쓰이거나 닫힌 뒤 쓰이면 실패하는 가짜 비동기 클라이언트"""
+
+    def __init__(self, content: str):
+        self.loop = asyncio.get_running_loop()
+        self.closed = False
+        self.content = content
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self._create))
+
+    async def _create(self, **kwargs):
+        if self.closed or asyncio.get_running_loop() is not self.loop:
+            raise RuntimeError("Event loop is closed")
+        message = SimpleNamespace(content=self.content)
+        return SimpleNamespace(choices=[SimpleNamespace(message=message)])
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        self.closed = True
+
+    async def close(self):
+        self.closed = True
+
+
+@pytest.fixture
+def personas():
+    return [Persona(id=str(i), data={"persona_text": f"테스트 페르소나 {i}"}) for i in range(3)]
+
+
+def test_conduct_interviews_can_run_twice(monkeypatch, personas):
+    agent = AIAgent(api_key="test-key")
+    monkeypatch.setattr(agent, "async_client", lambda: LoopBoundClient("좋은 제품이라고 생각합니다."))
+
+    system = InterviewSystem(agent)
+    guide = InterviewGuide("재실행 테스트")
+    guide.add_question("이 제품을 어떻게 생각하시나요?")
+    guide.add_question("개선할 점이 있나요?")
+
+    for _ in range(2):
+        interviews = system.conduct_interviews(personas, guide, delay=0)
+        responses = [resp for interview in interviews for resp in interview["responses"]]
+        assert len(responses) == len(personas) * 2
+        assert all(resp.get("error") is None for resp in responses)
+
+
+def test_conduct_survey_runs_concurrently_and_can_run_twice(monkeypatch, personas, tmp_path):
+    agent = AIAgent(api_key="test-key")
+    monkeypatch.setattr(agent, "async_client", lambda: LoopBoundClient("점수: 6\n이유: 만족합니다."))
+
+    system = SurveySystem(agent)
+    survey = Survey("재실행 테스트")
+    survey.add_question("만족하시나요?")
+    survey.add_question("추천하시겠습니까?")
+
+    for _ in range(2):
+        responses = system.conduct_survey(personas, survey, delay=0)
+        assert [(r["persona_id"], r["question_id"]) for r in responses] == [
+            (p.id, qid) for p in personas for qid in ("Q1", "Q2")
+        ]
+        assert all(r["score"] == 6 for r in responses)
+
+    # 스트리밍 모드에서는 결과를 반환하지 않고, 응답자별로 질문 순서대로 파일에 기록
+    stream_path = tmp_path / "survey.jsonl"
+    assert system.conduct_survey(personas, survey, delay=0, stream_path=str(stream_path)) == []
+    streamed = list(ResultsManager.load_jsonl(str(stream_path)))
+    pairs = [(r["persona_id"], r["question_id"]) for r in streamed]
+    assert sorted(pairs) == sorted((p.id, qid) for p in personas for qid in ("Q1", "Q2"))
+    assert all(pairs[i][0] == pairs[i + 1][0] for i in range(0, len(pairs), 2))
+
+
+def test_enhanced_survey_batch_can_run_twice(monkeypatch, personas):
+    pytest.importorskip("numpy")
+    pytest.importorskip("httpx")
+    from src.enhanced_ai_agent import EnhancedAIAgent
+
+    agent = EnhancedAIAgent(api_key="test-key")
+    monkeypatch.setattr(agent, "async_client", lambda: LoopBoundClient("점수: 5\n이유: 가격이 합리적입니다."))
+
+    try:
+        for _ in range(2):
+            results = agent.generate_enhanced_survey_response_batch(personas, ["만족하시나요?"])
+            flat = [result for row in results for result in row]
+            assert len(flat) == len(personas)
+            assert all("error" not in result for result in flat)
+            assert all(result["score"] == 5 for result in flat)
+    finally:
+        agent.close()
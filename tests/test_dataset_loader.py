@@ -0,0 +1,103 @@
+"""
+DatasetLoader 회귀 테스트
+"""
+
+import random
+
+import pytest
+
+pytest.importorskip("pandas")
+
+from src.dataset_loader import DatasetLoader, Persona
+
+
+@pytest.fixture
+def loader():
+    loader = DatasetLoader(csv_path="unused.csv")
+    loader.personas = [Persona(id=str(i), data={}) for i in range(100)]
+    return loader
+
+
+def test_random_sample_is_reproducible_with_seed(loader):
+    first = loader.get_random_sample(10, seed=42)
+    second = loader.get_random_sample(10, seed=42)
+    assert [p.id for p in first] == [p.id for p in second]
+
+    # 인덱스 기반 샘플링도 리스트를 직접 샘플링하던 방식과 같은 표본을 냄
+    random.seed(42)
+    assert [p.id for p in first] == [p.id for p in random.sample(loader.personas, 10)]
+
+
+def test_random_sample_larger_than_population_returns_copy(loader):
+    sample = loader.get_random_sample(500)
+    assert sample == loader.personas
+    assert sample is not loader.personas
+
+
+def test_low_cardinality_columns_are_categorized_at_load():
+    import pandas as pd
+
+    df = pd.DataFrame({
+        'id': [str(i) for i in range(10)],
+        'gender': ['남', '여'] * 5,
+        'age': list(range(10)),
+    })
+    categorized = DatasetLoader._categorize_columns(df)
+
+    assert isinstance(categorized['gender'].dtype, pd.CategoricalDtype)
+    assert categorized['id'].dtype == object
+    assert categorized['age'].dtype == df['age'].dtype
+    assert categorized.iloc[0].to_dict() == df.iloc[0].to_dict()
+
+
+@pytest.fixture
+def csv_loader(tmp_path):
+    import pandas as pd
+
+    csv_path = tmp_path / "personas.csv"
+    pd.DataFrame({
+        'id': [f"p{i}" for i in range(6)],
+        'gender': ['남', '여', '남', '여', '남', '여'],
+        'age': [20, 30, 40, 50, 60, 70],
+        'persona_text': [f"페르소나 {i}" for i in range(6)],
+    }).to_csv(csv_path, index=False, encoding='utf-8-sig')
+
+    loader = DatasetLoader(csv_path=str(csv_path))
+    loader.load()
+    return loader
+
+
+def test_get_persona_by_id_uses_loaded_personas(csv_loader):
+    persona = csv_loader.get_persona_by_id("p3")
+    assert persona is csv_loader.personas[3]
+    assert persona.data['age'] == 50
+    assert csv_loader.get_persona_by_id("missing") is None
+
+
+def test_search_personas_combines_filters(csv_loader):
+    results = csv_loader.search_personas({'gender': '남', 'age': [20, 60, 70]})
+    assert [p.id for p in results] == ['p0', 'p4']
+    assert results[0] is csv_loader.personas[0]
+
+    # 없는 값이나 없는 필드는 기존과 같게 처리
+    assert csv_loader.search_personas({'gender': '기타'}) == []
+    assert len(csv_loader.search_personas({'unknown': 1})) == 6
+
+
+def test_persona_data_keeps_column_types(csv_loader):
+    data = csv_loader.personas[0].data
+    assert data == {'id': 'p0', 'gender': '남', 'age': 20, 'persona_text': '페르소나 0'}
+    # iterrows는 혼합 타입 행을 object/float로 바꿨지만 레코드 변환은 원래 타입을 유지
+    assert isinstance(data['age'], int)
+
+
+def test_persona_ids_fall_back_to_row_index(tmp_path):
+    import pandas as pd
+
+    csv_path = tmp_path / "no_id.csv"
+    pd.DataFrame({'persona_text': ['가', '나', '다']}).to_csv(csv_path, index=False, encoding='utf-8-sig')
+
+    loader = DatasetLoader(csv_path=str(csv_path))
+    loader.load()
+    assert [p.id for p in loader.personas] == ['0', '1', '2']
+    assert loader.get_persona_by_id('2').data == {'persona_text': '다'}
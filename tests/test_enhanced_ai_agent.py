@@ -0,0 +1,103 @@
+"""
+EnhancedAIAgent 서베이 응답 파싱 회귀 테스트
+빠른 경로(LIKERT_RE)가 기존 파서와 같은 결과를 내는지 확인합니다.
+"""
+
+import re
+
+import pytest
+
+pytest.importorskip("numpy")
+pytest.importorskip("httpx")
+pytest.importorskip("openai")
+pytest.importorskip("pandas")
+
+from src.enhanced_ai_agent import EnhancedAIAgent
+
+
+def reference_parse(ai_response, scale_range=(1, 7)):
+    """최적화 이전의 리커트 응답 파서"""
+    score = None
+    score_match = re.search(r'점수:\s*(\d+)', ai_response)
+    if score_match:
+        score = max(scale_range[0], min(scale_range[1], int(score_match.group(1))))
+
+    reason_match = re.search(r'이유:\s*(.+)', ai_response)
+    reasoning = reason_match.group(1).strip() if reason_match else ai_response
+
+    clean_response = ai_response
+    if score_match and reason_match:
+        clean_response = re.sub(r'점수:\s*\d+\s*\n?', '', clean_response)
+        clean_response = re.sub(r'이유:\s*', '', clean_response)
+        clean_response = clean_response.strip()
+
+    return {'response': clean_response, 'score': score, 'reasoning': reasoning}
+
+
+@pytest.fixture(scope="module")
+def agent():
+    agent = EnhancedAIAgent(api_key="test-key")
+    yield agent
+    agent.close()
+
+
+@pytest.mark.parametrize("ai_response", [
+    "점수: 5\n이유: 가격이 합리적입니다.",
+    "점수: 9\n이유: 범위를 넘는 점수",
+    "점수:3 이유: 한 줄 응답",
+    "서론\n점수: 4\n이유: 앞에 다른 문장이 있음",
+    "점수: 5\n이유: 가격 이유: 좋음",
+    "점수: 5\n이유: 첫째\n이유: 둘째",
+    "점수: 2\n이유: 본문 안의 점수: 7 표시",
+    "점수: 6\n이유: 첫 줄\n둘째 줄은 설명",
+    "이유만 있습니다",
+])
+def test_likert_parse_matches_reference(agent, ai_response):
+    assert agent._parse_survey_response(ai_response, "likert", (1, 7)) == reference_parse(ai_response)
+
+
+def test_likert_reason_with_repeated_label(agent):
+    parsed = agent._parse_survey_response("점수: 5\n이유: 가격 이유: 좋음", "likert", (1, 7))
+    assert parsed == {'response': '가격 좋음', 'score': 5, 'reasoning': '가격 이유: 좋음'}
+
+
+@pytest.mark.parametrize("name", ["PERSONAL_INDICATORS", "REASON_INDICATORS"])
+def test_indicator_tuples_have_no_duplicates(name):
+    from src import enhanced_ai_agent
+
+    indicators = getattr(enhanced_ai_agent, name)
+    assert len(indicators) == len(set(indicators))
+
+
+def test_semantic_cache_round_trip_without_pickle(tmp_path):
+    import numpy as np
+    from src.enhanced_ai_agent import ResponseMetadata
+
+    path = tmp_path / "semantic_cache.npz"
+    key = ("1", "likert", (1, 7), ())
+    vec = np.array([0.6, 0.8], dtype=np.float32)
+    result = {
+        'response': '좋습니다',
+        'score': 6,
+        'reasoning': '가격',
+        'metadata': ResponseMetadata(0.8, '가격', ['나이'], '친근', '2024-01-01T00:00:00'),
+        'raw_ai_response': '점수: 6\n이유: 가격'
+    }
+
+    writer = EnhancedAIAgent(api_key="test-key", semantic_cache=True)
+    writer._semantic_cache_store(key, vec, result)
+    writer.save_semantic_cache(str(path))
+    writer.close()
+
+    # 저장 파일은 pickle 없이 읽을 수 있어야 함
+    with np.load(path, allow_pickle=False) as data:
+        assert 'meta' in data.files
+
+    reader = EnhancedAIAgent(api_key="test-key", semantic_cache=True, cache_path=str(path))
+    try:
+        cached = reader._semantic_cache_lookup(key, vec)
+        assert cached['score'] == 6
+        assert isinstance(cached['metadata'], ResponseMetadata)
+        assert cached['metadata'].persona_traits_used == ['나이']
+    finally:
+        reader.close()
@@ -0,0 +1,45 @@
+"""
+ResultsManager 내보내기 회귀 테스트
+"""
+
+import pytest
+
+pytest.importorskip("rich")
+pd = pytest.importorskip("pandas")
+pytest.importorskip("openpyxl")
+
+from src import results_manager
+from src.results_manager import ResultsManager
+
+
+MIXED_RESPONSES = [
+    {'persona_id': 1, 'question_id': 'Q1', 'question': '만족하시나요?', 'score': 5, 'reasoning': '좋음', 'category': None},
+    {'persona_id': 'x', 'question_id': 'Q1', 'question': '만족하시나요?', 'score': 3, 'reasoning': '보통', 'category': None},
+]
+
+
+def test_excel_fallback_handles_mixed_type_columns(monkeypatch, tmp_path):
+    # xlsxwriter가 없을 때의 pandas/openpyxl 경로를 강제
+    monkeypatch.setattr(results_manager, "_HAS_XLSXWRITER", False)
+    manager = ResultsManager(output_dir=str(tmp_path))
+
+    path = manager.export_to_excel(survey_responses=MIXED_RESPONSES, filename="mixed.xlsx")
+
+    df = pd.read_excel(path, sheet_name="Survey")
+    assert df['persona_id'].astype(str).tolist() == ['1', 'x']
+    assert df['score'].tolist() == [5, 3]
+
+
+def test_csv_keeps_minimal_quoting_and_float_format(tmp_path):
+    manager = ResultsManager(output_dir=str(tmp_path))
+    responses = [
+        {'persona_id': '1', 'question_id': 'Q1', 'question': '가격, 품질은?', 'score': 5.0,
+         'reasoning': '좋음', 'category': None, 'timestamp': '2024-01-01T00:00:00'},
+    ]
+
+    saved = manager.save_survey_results(responses, filename="fmt", formats=['csv'])
+
+    with open(saved['csv'], encoding='utf-8-sig', newline='') as f:
+        lines = f.read().split('\r\n')
+    assert lines[0] == 'persona_id,question_id,question,score,reasoning,category,timestamp'
+    assert lines[1] == '1,Q1,"가격, 품질은?",5.0,좋음,,2024-01-01T00:00:00'